@@ -2,13 +2,14 @@
 #Defining AUTO_TIMESERIES here
 ##########################################################
 import warnings
-warnings.filterwarnings(action='ignore')
-from typing import List, Dict, Optional, Tuple, Union
+from typing import Callable, List, Dict, Optional, Tuple, Union
+import logging
+import hashlib
+import io
+import sys
+from contextlib import redirect_stdout
 
 from datetime import datetime
-import copy
-from collections import defaultdict
-import operator
 from time import time
 import pdb
 
@@ -16,33 +17,476 @@ import pdb
 import pandas as pd  # type: ignore
 import numpy as np  # type: ignore
 
-# Modeling
-from sklearn.exceptions import DataConversionWarning # type: ignore
-#### The warnings from Sklearn are so annoying that I have to shut it off ####
-warnings.filterwarnings("ignore")
-warnings.filterwarnings(action='ignore', category=DataConversionWarning)
-
-# Plotting
-import seaborn as sns  # type: ignore
-
-def warn(*args, **kwargs):
-    pass
-warnings.warn = warn
+# Parallel model building
+from joblib import Memory, Parallel, delayed  # type: ignore
 
-############################################################
-import seaborn as sns  # type: ignore
-import matplotlib.pyplot as plt  # type: ignore
-sns.set(style="white", color_codes=True)
+# Modeling
+from sklearn.linear_model import LinearRegression  # type: ignore
 
 #######################################
 # Models
+# BuildProphet is imported only when a Prophet model is built since fbprophet is slow to import
 from .models import BuildBase, BuildArima, BuildAutoSarimax, BuildVAR, BuildML
-from .models.build_prophet import BuildProphet
 
 
 # Utils
 from .utils import colorful, load_ts_data, convert_timeseries_dataframe_to_supervised, \
                    time_series_plot, print_static_rmse, print_dynamic_rmse, quick_ts_plot
+from .utils.etl import _validate_dataframe
+from .utils.plotting import _configure_plot_style
+
+
+##################################################################################
+# Progress messages go through this logger. Its level is set from 'verbose':
+# INFO when verbose >= 1, otherwise only warnings (failed models, bad inputs) are shown.
+# The records propagate as usual. They are only printed to stdout here as long as the
+# application has not configured logging itself (no handlers on the root logger).
+##################################################################################
+class _DefaultHandler(logging.StreamHandler):
+    def emit(self, record):
+        if not logging.getLogger().handlers:
+            super().emit(record)
+
+
+logger = logging.getLogger("auto_ts")
+if not logger.handlers:
+    _handler = _DefaultHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_handler)
+
+
+def _log_banner(title: str) -> None:
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n\n" + "="*50 + "\n" + title + "\n" + "="*50 + "\n")
+
+
+##################################################################################
+# model_type values (lower case) that trigger each model family
+##################################################################################
+_BEST_KEYS = frozenset({'best'})
+_PROPHET_KEYS = frozenset({'prophet', 'best'})
+_SARIMAX_KEYS = frozenset({'arima', 'auto_arima', 'auto_sarimax', 'stats', 'best'})
+_VAR_KEYS = frozenset({'var', 'stats', 'best'})
+_ML_KEYS = frozenset({'ml', 'best'})
+
+
+##################################################################################
+# Time interval aliases accepted from the user and the default seasonal period of each
+##################################################################################
+_TIME_INTERVAL_ALIASES = {
+    'months': ['months', 'month', 'm'],
+    'days': ['days', 'daily', 'd'],
+    'weeks': ['weeks', 'weekly', 'w'],
+    'qtr': ['qtr', 'quarter', 'q'],
+    'semi': ['semi', 'semi-annual', '2q'],
+    'years': ['years', 'year', 'annual', 'y', 'a'],
+    'hours': ['hours', 'hourly', 'h'],
+    'minutes': ['minutes', 'minute', 'min', 'n'],
+    'seconds': ['seconds', 'second', 'sec', 's'],
+}
+_FREQ_MAP = {alias: canonical for canonical, aliases in _TIME_INTERVAL_ALIASES.items() for alias in aliases}
+
+_SEASONAL_PERIODS = {
+    'months': 12,
+    'days': 30,
+    'weeks': 52,
+    'qtr': 4,
+    'semi': 2,
+    'years': 1,
+    'hours': 24,
+    'minutes': 60,
+    'seconds': 60,
+}
+
+
+##################################################################################
+# Model builders
+# Each function below trains one model family and has no access to the
+# auto_timeseries object, so it can be shipped to a separate worker process.
+# They all return (name, model, forecasts, score_val, model_build).
+##################################################################################
+def _build_prophet(ts_df: pd.DataFrame, target: str, preds: List[str], cv: Optional[int], params: Dict) -> Tuple:
+    """
+    Builds the FB Prophet model
+    """
+    _log_banner("Building Prophet Model")
+
+    name = 'Prophet'
+    # Placeholder for cases when model can not be built
+    score_val = np.inf
+    model_build: Optional[BuildBase] = None
+    model = None
+    forecast_df_folds = None
+    logger.info(colorful.BOLD + '\nRunning Facebook Prophet Model...' + colorful.END)
+    try:
+        #### If FB prophet needs to run, it needs to be installed. Check it here ###
+        from .models.build_prophet import BuildProphet
+        model_build = BuildProphet(
+            params['forecast_period'], params['time_interval'],
+            params['score_type'], params['verbose'], params['conf_int'], params['holidays'], params['growth'],
+            params['seasonality'])
+        model, forecast_df_folds, rmse_folds, norm_rmse_folds = model_build.fit(
+            ts_df=ts_df,
+            target_col=target,
+            cv = cv,
+            time_col=params['ts_column'])
+
+        ##### Make sure that RMSE works, if not set it to np.inf  #########
+        if params['score_type'] == 'rmse':
+            score_val = rmse_folds
+        else:
+            score_val = norm_rmse_folds
+    except Exception:
+        logger.exception("Exception occurred while building Prophet model...")
+        logger.warning('    FB Prophet may not be installed or Model is not running...')
+
+    return name, model, forecast_df_folds, score_val, model_build
+
+
+def _build_auto_sarimax(ts_df: pd.DataFrame, target: str, preds: List[str], cv: Optional[int], params: Dict) -> Tuple:
+    """
+    Builds the Auto SARIMAX model
+    """
+    _log_banner("Building Auto SARIMAX Model")
+
+    name = 'auto_SARIMAX'
+    # Placeholder for cases when model can not be built
+    score_val = np.inf
+    model_build = None
+    model = None
+    forecast_df_folds = None
+
+    logger.info(colorful.BOLD + '\nRunning Auto SARIMAX Model...' + colorful.END)
+    try:
+        model_build = BuildAutoSarimax(
+            scoring=params['stats_scoring'],
+            seasonality=params['seasonality'],
+            seasonal_period=params['seasonal_period'],
+            p_max=params['p_max'], d_max=params['d_max'], q_max=params['q_max'],
+            forecast_period=params['forecast_period'],
+            verbose=params['verbose'],
+            d=params['d']
+        )
+        model, forecast_df_folds, rmse_folds, norm_rmse_folds = model_build.fit(
+            ts_df=ts_df,
+            target_col=target,
+            cv = cv
+        )
+
+        if params['score_type'] == 'rmse':
+            score_val = rmse_folds
+        else:
+            score_val = norm_rmse_folds
+    except Exception:
+        logger.exception("Exception occurred while building Auto SARIMAX model...")
+        logger.warning('    Auto SARIMAX model error: predictions not available.')
+
+    return name, model, forecast_df_folds, score_val, model_build
+
+
+def _shift_predictors(ts_df: pd.DataFrame, target: str, preds: List[str]) -> pd.DataFrame:
+    """
+    Returns the target with the preds shifted by 1 (the prior value of each predictor next to
+    the current target) and the rows with missing values dropped, like
+    ts_df.copy() with [preds].shift(1) and dropna() but without copying ts_df first.
+    ts_df itself must not be changed since it is also passed to ML (see
+    https://github.com/AutoViML/Auto_TS/issues/15)
+    """
+    # Shifting by 1 only leaves the first row empty, so slice it off instead of dropna
+    shifted_cols = {col: ts_df[col].to_numpy()[:-1] for col in preds}
+    ts_df_shifted = pd.DataFrame({target: ts_df[target].to_numpy()[1:], **shifted_cols},
+                                 index=ts_df.index[1:])
+    if ts_df_shifted.isnull().values.any():
+        ### The input itself has missing values, drop those rows as before
+        ts_df_shifted = ts_df_shifted.dropna(axis=0)
+    return ts_df_shifted
+
+
+def _build_var(ts_df: pd.DataFrame, target: str, preds: List[str], cv: Optional[int], params: Dict) -> Tuple:
+    """
+    Builds the VAR model - but first we have to shift the predictor vars
+    """
+    _log_banner("Building VAR Model")
+
+    name = 'VAR'
+    # Placeholder for cases when model can not be built
+    score_val = np.inf
+    model_build = None
+    model = None
+    forecasts = None
+
+    if len(preds) == 0:
+        logger.warning(colorful.BOLD + '\nNo VAR model created since no explanatory variables given in data set' + colorful.END)
+    else:
+        try:
+            logger.info(colorful.BOLD + '\nRunning VAR Model...' + colorful.END)
+            logger.info('    Shifting %d predictors by 1 to align prior predictor values with current target values...'
+                                    %len(preds))
+
+            ts_df_shifted = _shift_predictors(ts_df, target, preds)
+
+            model_build = BuildVAR(scoring=params['stats_scoring'], forecast_period=params['forecast_period'],
+                                   p_max=params['p_max'], q_max=params['q_max'])
+            model, forecasts, rmse, norm_rmse = model_build.fit(
+                ts_df_shifted,
+                target_col=target,
+                cv = cv
+            )
+
+            if params['score_type'] == 'rmse':
+                score_val = rmse
+            else:
+                score_val = norm_rmse
+        except Exception:
+            logger.exception("Exception occurred while building VAR model...")
+            logger.warning('    VAR model error: predictions not available.')
+
+    return name, model, forecasts, score_val, model_build
+
+
+def _build_ml(ts_df: pd.DataFrame, target: str, preds: List[str], cv: Optional[int], params: Dict) -> Tuple:
+    """
+    Builds a Machine Learning Model with Time Series Data
+    """
+    _log_banner("Building ML Model")
+
+    name = 'ML'
+    # Placeholder for cases when model can not be built
+    score_val = np.inf
+    model_build = None
+    model = None
+    forecasts = None
+    lag = params['lag']
+    if lag <= 4:
+        lag = 4 ### set the minimum lags to be at least 4 for ML models
+    elif lag >= 10:
+        lag = 10 ### set the maximum lags to be not more than 10 for ML models
+    if len(preds) == 0:
+        logger.warning(colorful.BOLD + '\nNo predictors available. Skipping Machine Learning model...' + colorful.END)
+    else:
+        try:
+            logger.info(colorful.BOLD + '\nRunning Machine Learning Models...' + colorful.END)
+            logger.info('    Shifting %d predictors by lag=%d to align prior predictor with current target...'
+                        % (len(preds), lag))
+
+            model_build = BuildML(
+                scoring=params['score_type'],
+                forecast_period = params['forecast_period'],
+                verbose=params['verbose'],
+                n_jobs=params['n_jobs'],
+                successive_halving=params['successive_halving']
+            )
+
+            model, forecasts, rmse, norm_rmse = model_build.fit(
+                ts_df=ts_df,
+                target_col=target,
+                cv = cv,
+                lags=lag
+            )
+
+            if params['score_type'] == 'rmse':
+                score_val = rmse
+            else:
+                score_val = norm_rmse
+        except Exception:
+            logger.exception("Exception occurred while building ML model...")
+            logger.warning('    For ML model, evaluation score is not available.')
+
+    return name, model, forecasts, score_val, model_build
+
+
+_NS_PER_DAY = 86_400_000_000_000
+_NS_PER_HOUR = 3_600_000_000_000
+
+
+def _infer_time_interval(index: pd.Index) -> str:
+    """
+    Infers the time_interval from the median spacing of a datetime index, so that a few
+    missing or irregular timestamps do not throw it off. The index may also be descending.
+    Raises a ValueError if the spacing does not match any of the intervals below.
+    """
+    # In nanoseconds whatever the resolution of the index (newer pandas also has 's', 'ms', 'us')
+    times = pd.DatetimeIndex(index).dropna().values.astype('datetime64[ns]').view('i8')
+    if times.shape[0] < 2:
+        raise ValueError('At least 2 timestamps are needed to infer the time interval. '
+                         'Please give the time_interval argument.')
+    median_ns = abs(int(np.median(np.diff(times))))
+    diff_in_days, remainder_ns = divmod(median_ns, _NS_PER_DAY)
+    interval = None
+    if median_ns == 0:
+        pass
+    elif remainder_ns == 0:
+        logger.info('Time series input in days = %s' % diff_in_days)
+        if diff_in_days == 7:
+            logger.info('It is a Weekly time series.')
+            interval = 'weeks'
+        elif diff_in_days == 1:
+            logger.info('It is a Daily time series.')
+            interval = 'days'
+        elif 28 <= diff_in_days < 89:
+            logger.info('It is a Monthly time series.')
+            interval = 'months'
+        elif 89 <= diff_in_days < 178:
+            logger.info('It is a Quarterly time series.')
+            interval = 'qtr'
+        elif 178 <= diff_in_days < 360:
+            logger.info('It is a Semi Annual time series.')
+            interval = 'semi'
+        elif diff_in_days >= 360:
+            logger.info('It is an Annual time series.')
+            interval = 'years'
+    elif diff_in_days == 0:
+        if median_ns < _NS_PER_HOUR:
+            logger.info('Time series input in Minutes or Seconds = %s' % (median_ns // 1_000_000_000))
+            logger.info('It is a Minute time series.')
+            interval = 'minutes'
+        else:
+            logger.info('It is an Hourly time series.')
+            interval = 'hours'
+    if interval is None:
+        raise ValueError(
+            'Could not infer the time interval: the median spacing of the timestamps is %s, which is '
+            'not minutes, hours, 1 or 7 days, or about a month, quarter, half year or year. '
+            'Please give the time_interval argument.' % pd.Timedelta(median_ns))
+    return interval
+
+
+def _estimate_d(y: np.ndarray, X: Optional[np.ndarray] = None, alpha: float = 0.05,
+                max_d: int = 2) -> Optional[int]:
+    """
+    Number of differences needed to make y stationary using the KPSS test. This is the
+    same estimate that auto_arima makes when d is not given: with exogenous variables X,
+    it is computed on the residuals of a linear regression of y on X. Returns None if it fails.
+    """
+    try:
+        # pmdarima imports statsmodels.graphics, which loads matplotlib.pyplot
+        from pmdarima.arima import ndiffs  # type: ignore
+        if X is not None:
+            y = y - LinearRegression().fit(X, y).predict(X)
+        return int(ndiffs(y, alpha=alpha, test='kpss', max_d=max_d))
+    except Exception as e:
+        logger.warning('Could not estimate the order of differencing: %s', e)
+        return None
+
+
+class _RecordCollector(logging.Handler):
+    """
+    Keeps the log records of a worker process in memory so that they can be returned
+    with its result. The message is formatted here since the args (and tracebacks) of
+    a record can not always be pickled.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record):
+        record.msg = self.format(record)
+        record.args, record.exc_info, record.exc_text, record.stack_info = None, None, None, None
+        self.records.append(record)
+
+
+class _LoggerWriter(io.TextIOBase):
+    """
+    Stands in for stdout while a model is built, so that what the model builds print is
+    logged (at INFO, one record per line) like the rest of the progress messages.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self._partial = ''
+
+    def write(self, text):
+        *lines, self._partial = (self._partial + text).split('\n')
+        for line in lines:
+            logger.info(line)
+        return len(text)
+
+    def flush(self):
+        if self._partial:
+            logger.info(self._partial)
+            self._partial = ''
+
+
+def _frame_key(ts_df: pd.DataFrame) -> str:
+    """
+    Hash of the values, columns and index of ts_df, used as the cache key of the data.
+    joblib's own hash of a DataFrame also covers what pandas caches on it when it is only
+    read (e.g. index.inferred_freq), so it can change while a model is being built.
+    """
+    digest = hashlib.sha1(pd.util.hash_pandas_object(ts_df, index=True).values.tobytes())
+    digest.update(repr((list(ts_df.columns), ts_df.dtypes.astype(str).tolist(), ts_df.index.name,
+                        str(ts_df.index.dtype), str(getattr(ts_df.index, 'freq', None)))).encode())
+    return digest.hexdigest()
+
+
+def _run_model_job(builder: Callable, log_level: int, collect_logs: bool, data_key: Optional[str],
+                   ts_df: pd.DataFrame, *args) -> Tuple:
+    """
+    Runs one model builder. Worker processes do not share the logger configuration or the
+    warning filters of the parent process, so both are set again here before building the model.
+    Returns the result of the builder and, if collect_logs is True, the log records written
+    while building it (instead of writing them here) so that the parent can emit them.
+    The prints of the model builds are logged as well (see _LoggerWriter).
+    data_key identifies ts_df in the cache (see _frame_key), it is not used otherwise.
+    """
+    logger.setLevel(log_level)
+    handlers = logger.handlers
+    collector = _RecordCollector()
+    if collect_logs:
+        logger.handlers = [collector]
+    stdout = _LoggerWriter()
+    try:
+        with warnings.catch_warnings(), redirect_stdout(stdout):
+            warnings.simplefilter('ignore')
+            result = builder(ts_df, *args)
+    finally:
+        stdout.flush()
+        logger.handlers = handlers
+    return result, collector.records
+
+
+##################################################################################
+# Model families in the order they are built and stored in ml_dict:
+# (name, model_type keys that select it, builder, whether it gets all columns of ts_df
+# instead of only the target and preds, whether it needs preds to be built at all)
+##################################################################################
+_MODEL_SPECS = [
+    ('Prophet', _PROPHET_KEYS, _build_prophet, False, False),
+    ('auto_SARIMAX', _SARIMAX_KEYS, _build_auto_sarimax, False, False),
+    ('VAR', _VAR_KEYS, _build_var, False, True),
+    ('ML', _ML_KEYS, _build_ml, True, True),
+]
+
+
+class ModelEntry:
+    """
+    One model in ml_dict: the fitted model, its forecasts, its (CV) score and the model build.
+    The fields can also be read like the keys of a dictionary, e.g. entry.get('model') or
+    entry[score_type] for the score, so existing code that used the nested dictionaries still works.
+    """
+    __slots__ = ('model', 'forecast', 'score', 'model_build', 'score_type')
+
+    def __init__(self, model, forecast, score, model_build, score_type: str = 'rmse'):
+        self.model = model
+        self.forecast = forecast
+        self.score = score
+        self.model_build = model_build
+        self.score_type = score_type
+
+    def __getitem__(self, key: str):
+        if key == self.score_type:
+            return self.score
+        if key in ('model', 'forecast', 'model_build'):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __repr__(self) -> str:
+        return f"ModelEntry(model={self.model!r}, {self.score_type}={self.score!r})"
 
 
 class auto_timeseries:
@@ -57,6 +501,9 @@ class auto_timeseries:
         conf_int: float = 0.95,
         model_type: Union[str, List] = "stats",
         verbose: int = 0,
+        n_jobs: int = -1,
+        cache_dir: Optional[str] = None,
+        successive_halving: bool = False,
         *args,
         **kwargs
     ):
@@ -124,8 +571,24 @@ class auto_timeseries:
         :type model_type: Union[str, List]
 
         :param verbose Indicates the verbosity of printing (Default = 0)
+        With verbose = 0 only warnings are logged (to the "auto_ts" logger); progress messages need verbose >= 1
         :type verbose int
 
+        :param n_jobs The number of model families (Prophet, SARIMAX, VAR, ML) to build in parallel.
+        Each family is built in its own worker process. -1 uses all available cores,
+        1 builds the models one after the other in the current process. Default = -1
+        It is also the number of threads used to cross validate the ML candidate models.
+        :type n_jobs int
+
+        :param cache_dir Directory in which the fitted models are cached (with joblib.Memory).
+        Fitting again with the same data and settings then loads each model family from disk
+        instead of building it again. None (default) disables the cache.
+        :type cache_dir Optional[str]
+
+        :param successive_halving If True, the ML candidate models are first scored on the last 2 folds
+        only and just the most promising ones are cross validated on all cv folds. Default = False
+        :type successive_halving bool
+
         ##################################################################################################
         AUTO_TIMESERIES IS A COMPLEX MODEL BUILDING UTILITY FOR TIME SERIES DATA. SINCE IT AUTOMATES MANY
         TASKS INVOLVED IN A COMPLEX ENDEAVOR, IT ASSUMES MANY INTELLIGENT DEFAULTS. BUT YOU CAN CHANGE THEM.
@@ -133,7 +596,14 @@ class auto_timeseries:
         and Scikit-Learn ML. It will automatically select the BEST model which gives best score specified.
         #####################################################################################################
         """
-        self.ml_dict: Dict = {}
+        self.ml_dict: Dict[str, ModelEntry] = {}
+        # Best model so far, kept up to date while the results are added to ml_dict
+        self._best_name: Optional[str] = None
+        self._best_score: float = np.inf
+        self._best_build = None
+        # Names and mean CV scores of the models in ml_dict, in the same order
+        self._names: List[str] = []
+        self._scores: np.ndarray = np.empty(0)
         self.score_type: str = score_type
         self.forecast_period =  forecast_period
         self.time_interval = time_interval
@@ -144,17 +614,23 @@ class auto_timeseries:
         if isinstance(model_type, str):
             model_type = [model_type]
         self.model_type = model_type
+        self._model_types = frozenset(str(elem).lower() for elem in model_type)
         self.verbose = verbose
+        logger.setLevel(logging.INFO if self.verbose else logging.WARNING)
+        self.n_jobs = n_jobs
+        self.cache_dir = cache_dir
+        self.successive_halving = successive_halving
         self.holidays = None
         self.growth = "linear"
         self.allowed_models = ['best', 'prophet', 'stats', 'ml', 'arima','ARIMA','Prophet','SARIMAX', 'VAR', 'ML']
+        self._allowed_lower = frozenset(elem.lower() for elem in self.allowed_models)
 
         # new function.
         if args:
             for each_arg in args:
                 print(each_arg)
         if kwargs:
-            for key, value in zip(kwargs.keys(), kwargs.values()):
+            for key, value in kwargs.items():
                 if key == 'seasonal_PDQ':
                     print('seasonal_PDQ argument is deprecated. Please remove the argument in future.')
                 if key == 'holidays':
@@ -200,20 +676,36 @@ class auto_timeseries:
             Default is None which treats the sep as a comma (datafile as a 'csv').
         :type sep Optional[str]
         """
+        #### The warnings from statsmodels and sklearn are so annoying that they are shut off,
+        #### but only while fitting so that warnings elsewhere in the user's code still show up
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            return self._fit(traindata, ts_column, target, sep, cv)
 
+    def _fit(
+        self,
+        traindata: Union[str, pd.DataFrame],
+        ts_column: Union[str, int, List[str]],
+        target: Union[str, List[str]],
+        sep: Optional[str],
+        cv: Optional[int],
+        ):
+        """
+        Does the actual training for fit() (see fit for the arguments)
+        """
         list_of_valid_time_ints = ['B','C','D','W','M','SM','BM','CBM',
                                         'MS','SMS','BMS','CBMS','Q','BQ','QS','BQS',
                                         'A,Y','BA,BY','AS,YS','BAS,BYS','BH',
                                         'H','T,min','S','L,ms','U,us','N']
 
         start = time()
-        print("Start of Fit.....")
+        logger.info("Start of Fit.....")
 
         ##### Best hyper-parameters in statsmodels chosen using the best aic, bic or whatever. Select here.
         stats_scoring = 'aic'
 
         ### If run_prophet is set to True, then only 1 model will be run and that is FB Prophet ##
-        lag = copy.deepcopy(self.forecast_period)-1
+        lag = self.forecast_period - 1
 
         # if type(self.non_seasonal_pdq) == tuple:
         if isinstance(self.non_seasonal_pdq, tuple):
@@ -234,7 +726,7 @@ class auto_timeseries:
             ts_column = list(ts_df)[ts_column]
         if isinstance(ts_column, list):
             # If it is of type List, just pick the first one
-            print("\nYou have provided a list as the 'ts_column' argument. Will pick the first value as the 'ts_column' name.")
+            logger.info("\nYou have provided a list as the 'ts_column' argument. Will pick the first value as the 'ts_column' name.")
             ts_column = ts_column[0]
 
 
@@ -243,11 +735,11 @@ class auto_timeseries:
         # Check 'target' type
         if isinstance(target, list):
             target = target[0]
-            print('    Auto_TS cannot handle Multi-Label targets. Taking first column in target list as Target = %s' %target)
+            logger.warning('    Auto_TS cannot handle Multi-Label targets. Taking first column in target list as Target = %s' %target)
         else:
-            print('    Target variable given as = %s' %target)
+            logger.info('    Target variable given as = %s' %target)
 
-        print("Start of loading of data.....")
+        logger.info("Start of loading of data.....")
 
         if sep is None:
             sep = ','
@@ -258,26 +750,26 @@ class auto_timeseries:
                 try:
                     ts_df = load_ts_data(traindata, self.ts_column, sep, target)
                     if isinstance(ts_df, str):
-                        print("""Time Series column '%s' could not be converted to a Pandas date time column.
+                        logger.warning("""Time Series column '%s' could not be converted to a Pandas date time column.
                             Please convert your ts_column into a pandas date-time and try again""" %self.ts_column)
                         return None
                     else:
-                        print('    File loaded successfully. Shape of data set = %s' %(ts_df.shape,))
+                        logger.info('    File loaded successfully. Shape of data set = %s' %(ts_df.shape,))
                 except Exception:
-                    print('File could not be loaded. Check the path or filename and try again')
+                    logger.warning('File could not be loaded. Check the path or filename and try again')
                     return None
         elif isinstance(traindata, pd.DataFrame):
-            print('Input is data frame. Performing Time Series Analysis')
-            print(f"ts_column: {self.ts_column} sep: {sep} target: {target}")
-            ts_df = load_ts_data(traindata, self.ts_column, sep, target)
+            logger.info('Input is data frame. Performing Time Series Analysis')
+            logger.info(f"ts_column: {self.ts_column} target: {target}")
+            ts_df = _validate_dataframe(traindata, self.ts_column, target)
             if isinstance(ts_df, str):
-                print("""Time Series column '%s' could not be converted to a Pandas date time column.
+                logger.warning("""Time Series column '%s' could not be converted to a Pandas date time column.
                     Please convert your input into a date-time column  and try again""" %self.ts_column)
                 return None
             else:
-                print('    Dataframe loaded successfully. Shape of data set = %s' %(ts_df.shape,))
+                logger.info('    Dataframe loaded successfully. Shape of data set = %s' %(ts_df.shape,))
         else:
-            print('File name is an empty string. Please check your input and try again')
+            logger.warning('File name is an empty string. Please check your input and try again')
             return None
 
 
@@ -296,7 +788,6 @@ class auto_timeseries:
         if ts_df.index.dtype=='int' or ts_df.index.dtype=='float':
             ### You must convert the ts_df index into a date-time series using the ts_column given ####
             ts_df = ts_df.set_index(self.ts_column)
-        ts_index = ts_df.index
 
         ## TODO: Be sure to also assign a frequency to the index column
         ## This will be helpful when finding the "future dataframe" especially for ARIMA, and ML.
@@ -307,58 +798,14 @@ class auto_timeseries:
         #### This is where the program tries to tease out the time period in the data set ####
         ######################################################################################
         if self.time_interval is None:
-            print("Time Interval between obserations has not been provided. Auto_TS will try to infer this now...")
-            ts_index = pd.to_datetime(ts_df.index)
-            diff = (ts_index[1] - ts_index[0]).to_pytimedelta()
-            diffdays = diff.days
-            diffsecs = diff.seconds
-
-            if diffsecs == 0:
-                diff_in_hours = 0
-                diff_in_days = abs(diffdays)
-            else:
-                diff_in_hours = abs(diffdays*24*3600 + diffsecs)/3600
-
-            if diff_in_hours == 0 and diff_in_days >= 1:
-                print('Time series input in days = %s' % diff_in_days)
-                if diff_in_days == 7:
-                    print('It is a Weekly time series.')
-                    self.time_interval = 'weeks'
-                elif diff_in_days == 1:
-                    print('It is a Daily time series.')
-                    self.time_interval = 'days'
-                elif 28 <= diff_in_days < 89:
-                    print('It is a Monthly time series.')
-                    self.time_interval = 'months'
-                elif 89 <= diff_in_days < 178:
-                    print('It is a Quarterly time series.')
-                    self.time_interval = 'qtr'
-                elif 178 <= diff_in_days < 360:
-                    print('It is a Semi Annual time series.')
-                    self.time_interval = 'semi'
-                elif diff_in_days >= 360:
-                    print('It is an Annual time series.')
-                    self.time_interval = 'years'
-                else:
-                    print('Time Series time delta is unknown')
-                    return None
-            if diff_in_days == 0:
-                if diff_in_hours == 0:
-                    print('Time series input in Minutes or Seconds = %s' % diff_in_hours)
-                    print('It is a Minute time series.')
-                    self.time_interval = 'minutes'
-                elif diff_in_hours >= 1:
-                    print('It is an Hourly time series.')
-                    self.time_interval = 'hours'
-                else:
-                    print('It is an Unknown Time Series delta')
-                    return None
+            logger.info("Time Interval between obserations has not been provided. Auto_TS will try to infer this now...")
+            self.time_interval = _infer_time_interval(ts_df.index)
         else:
-            print('Time Interval is given as %s' % self.time_interval)
+            logger.info('Time Interval is given as %s' % self.time_interval)
             if self.time_interval in list_of_valid_time_ints:
-                print('    Correct Time interval given as a valid Pandas date-range frequency...')
+                logger.info('    Correct Time interval given as a valid Pandas date-range frequency...')
             else:
-                print('    Error: You must give a valid time interval frequency from Pandas date-range frequency codes')
+                logger.warning('    Error: You must give a valid time interval frequency from Pandas date-range frequency codes')
                 return None
 
         ################# This is where you test the data and find the time interval #######
@@ -366,376 +813,167 @@ class auto_timeseries:
             if self.time_interval in list_of_valid_time_ints:
                 pass
             else:
-                self.time_interval = self.time_interval.strip().lower()
-                if self.time_interval in ['months', 'month', 'm']:
-                    self.time_interval = 'months'
-                elif self.time_interval in ['days', 'daily', 'd']:
-                    self.time_interval = 'days'
-                elif self.time_interval in ['weeks', 'weekly', 'w']:
-                    self.time_interval = 'weeks'
-                elif self.time_interval in ['qtr', 'quarter', 'q']:
-                    self.time_interval = 'qtr'
-                elif self.time_interval in ['semi', 'semi-annual', '2q']:
-                    self.time_interval = 'semi'
-                elif self.time_interval in ['years', 'year', 'annual', 'y', 'a']:
-                    self.time_interval = 'years'
-                elif self.time_interval in ['hours', 'hourly', 'h']:
-                    self.time_interval = 'hours'
-                elif self.time_interval in ['minutes', 'minute', 'min', 'n']:
-                    self.time_interval = 'minutes'
-                elif self.time_interval in ['seconds', 'second', 'sec', 's']:
-                    self.time_interval = 'seconds'
-                else:
-                    self.time_interval = 'months' # Default is Monthly
-                    print('Time Interval not provided. Setting default as Monthly')
+                time_interval = self.time_interval.strip().lower()
+                self.time_interval = _FREQ_MAP.get(time_interval, 'months') # Default is Monthly
+                if time_interval not in _FREQ_MAP:
+                    logger.warning('Time Interval not provided. Setting default as Monthly')
         else:
-            print("(Error: 'self.time_interval' is None. This condition should not have occurred.")
+            logger.warning("(Error: 'self.time_interval' is None. This condition should not have occurred.")
             return
 
         # Impute seasonal_period if not provided by the user
         if self.seasonal_period is None:
-            if self.time_interval == 'months':
-                self.seasonal_period = 12
-            elif self.time_interval == 'days':
-                self.seasonal_period = 30
-            elif self.time_interval in 'weeks':
-                self.seasonal_period = 52
-            elif self.time_interval in 'qtr':
-                self.seasonal_period = 4
-            elif self.time_interval in 'semi':
-                self.seasonal_period = 2
-            elif self.time_interval in 'years':
-                self.seasonal_period = 1
-            elif self.time_interval in 'hours':
-                self.seasonal_period = 24
-            elif self.time_interval in 'minutes':
-                self.seasonal_period = 60
-            elif self.time_interval in 'seconds':
-                self.seasonal_period = 60
-            else:
-                self.seasonal_period = 12  # Default is Monthly
+            self.seasonal_period = _SEASONAL_PERIODS.get(self.time_interval, 12)  # Default is Monthly
 
 
-        ########################### This is where we store all models in a nested dictionary ##########
-        mldict = lambda: defaultdict(mldict)
-        self.ml_dict = mldict()
+        ########################### This is where we store all models: name -> ModelEntry ############
+        self.ml_dict = {}
+        self._best_name, self._best_score, self._best_build = None, np.inf, None
+        self._names, self._scores = [], np.empty(0)
         try:
-            if self.__any_contained_in_list(what_list=['best'], in_list=self.model_type):
-                print(colorful.BOLD +'WARNING: Running best models will take time... Be Patient...' + colorful.END)
+            if not self._model_types.isdisjoint(_BEST_KEYS):
+                logger.info(colorful.BOLD +'WARNING: Running best models will take time... Be Patient...' + colorful.END)
         except Exception:
-            print('Check if your model type is a string or one of the available types of models')
+            logger.warning('Check if your model type is a string or one of the available types of models')
 
 
         ######### This is when you need to use FB Prophet ###################################
         ### When the time interval given does not match the tested_time_interval, then use FB.
         #### Also when the number of rows in data set is very large, use FB Prophet, It is fast.
-        #########                 FB Prophet              ###################################
-
-        if self.__any_contained_in_list(what_list=['prophet', 'Prophet', 'best'], in_list=self.model_type):
-            print("\n")
-            print("="*50)
-            print("Building Prophet Model")
-            print("="*50)
-            print("\n")
-
-            name = 'Prophet'
-            # Placeholder for cases when model can not be built
-            score_val = np.inf
-            model_build: Optional[BuildBase] = None
-            model = None
-            forecasts = None
-            print(colorful.BOLD + '\nRunning Facebook Prophet Model...' + colorful.END)
-            try:
-                #### If FB prophet needs to run, it needs to be installed. Check it here ###
-                model_build = BuildProphet(
-                    self.forecast_period, self.time_interval,
-                    self.score_type, self.verbose, self.conf_int, self.holidays, self.growth,
-                    self.seasonality)
-                model, forecast_df_folds, rmse_folds, norm_rmse_folds = model_build.fit(
-                    ts_df=ts_df[[target]+preds],
-                    target_col=target,
-                    cv = cv,
-                    time_col=self.ts_column)
-
-                # forecasts = forecast_df['yhat'].values
-
-                ##### Make sure that RMSE works, if not set it to np.inf  #########
-                if self.score_type == 'rmse':
-                    score_val = rmse_folds
-                else:
-                    score_val = norm_rmse_folds
-            except Exception as e:
-                print("Exception occurred while building Prophet model...")
-                print(e)
-                print('    FB Prophet may not be installed or Model is not running...')
-
-            self.ml_dict[name]['model'] = model
-            self.ml_dict[name]['forecast'] = forecast_df_folds
-            self.ml_dict[name][self.score_type] = score_val
-            self.ml_dict[name]['model_build'] = model_build
-
-
-        # if self.__any_contained_in_list(what_list=['ARIMA', 'stats', 'best'], in_list=self.model_type):
-        #     ################### Let's build an ARIMA Model and add results #################
-        #     print("\n")
-        #     print("="*50)
-        #     print("Building ARIMA Model")
-        #     print("="*50)
-        #     print("\n")
-
-        #     name = 'ARIMA'
-
-        #     # Placeholder for cases when model can not be built
-        #     score_val = np.inf
-        #     model_build = None
-        #     model = None
-        #     forecasts = None
-        #     print(colorful.BOLD + '\nRunning Non Seasonal ARIMA Model...' + colorful.END)
-        #     try:
-        #         model_build = BuildArima(
-        #             stats_scoring, p_max, d_max, q_max,
-        #             forecast_period=self.forecast_period, method='mle', verbose=self.verbose
-        #         )
-        #         model, forecasts, rmse, norm_rmse = model_build.fit(
-        #             ts_df[target]
-        #         )
-
-        #         if self.score_type == 'rmse':
-        #             score_val = rmse
-        #         else:
-        #             score_val = norm_rmse
-        #     except Exception as e:
-        #         print("Exception occurred while building ARIMA model...")
-        #         print(e)
-        #         print('    ARIMA model error: predictions not available.')
-
-        #     self.ml_dict[name]['model'] = model
-        #     self.ml_dict[name]['forecast'] = forecasts
-        #     self.ml_dict[name][self.score_type] = score_val
-        #     self.ml_dict[name]['model_build'] = model_build
-
-
-        if self.__any_contained_in_list(what_list=['ARIMA','arima','auto_arima','auto_SARIMAX', 'stats', 'best'], in_list=self.model_type):
-            ############# Let's build a SARIMAX Model and get results ########################
-            print("\n")
-            print("="*50)
-            print("Building Auto SARIMAX Model")
-            print("="*50)
-            print("\n")
-
-            name = 'auto_SARIMAX'
-            # Placeholder for cases when model can not be built
-            score_val = np.inf
-            model_build = None
-            model = None
-            forecast_df_folds = None
-
-            print(colorful.BOLD + '\nRunning Auto SARIMAX Model...' + colorful.END)
-            try:
-                model_build = BuildAutoSarimax(
-                    scoring=stats_scoring,
-                    seasonality=self.seasonality,
-                    seasonal_period=self.seasonal_period,
-                    p_max=p_max, d_max=d_max, q_max=q_max,
-                    forecast_period=self.forecast_period,
-                    verbose=self.verbose
-                )
-                model, forecast_df_folds, rmse_folds, norm_rmse_folds = model_build.fit(
-                    ts_df=ts_df[[target]+preds],
-                    target_col=target,
-                    cv = cv
-                )
-
-                if self.score_type == 'rmse':
-                    score_val = rmse_folds
-                else:
-                    score_val = norm_rmse_folds
-            except Exception as e:
-                print("Exception occurred while building Auto SARIMAX model...")
-                print(e)
-                print('    Auto SARIMAX model error: predictions not available.')
-
-
-            self.ml_dict[name]['model'] = model
-            self.ml_dict[name]['forecast'] = forecast_df_folds
-            self.ml_dict[name][self.score_type] = score_val
-            self.ml_dict[name]['model_build'] = model_build
-
-
-        if self.__any_contained_in_list(what_list=['var','Var','VAR', 'stats', 'best'], in_list=self.model_type):
-            ########### Let's build a VAR Model - but first we have to shift the predictor vars ####
-
-            print("\n")
-            print("="*50)
-            print("Building VAR Model")
-            print("="*50)
-            print("\n")
-
-            name = 'VAR'
-            # Placeholder for cases when model can not be built
-            score_val = np.inf
-            model_build = None
-            model = None
-            forecasts = None
-
-            if len(preds) == 0:
-                print(colorful.BOLD + '\nNo VAR model created since no explanatory variables given in data set' + colorful.END)
-            else:
-                try:
-                    print(colorful.BOLD + '\nRunning VAR Model...' + colorful.END)
-                    print('    Shifting %d predictors by 1 to align prior predictor values with current target values...'
-                                            %len(preds))
-
-                    # TODO: This causes an issue later in ML (most likely cause of https://github.com/AutoViML/Auto_TS/issues/15)
-                    # Since we are passing ts_df there. Make sure you don't assign it
-                    # back to the same variable. Make a copy and make changes to that copy.
-                    ts_df_shifted = ts_df.copy(deep=True)
-                    ts_df_shifted[preds] = ts_df_shifted[preds].shift(1)
-                    ts_df_shifted.dropna(axis=0,inplace=True)
-
-                    model_build = BuildVAR(scoring=stats_scoring, forecast_period=self.forecast_period, p_max=p_max, q_max=q_max)
-                    model, forecasts, rmse, norm_rmse = model_build.fit(
-                        ts_df_shifted[[target]+preds],
-                        target_col=target,
-                        cv = cv
-                    )
-
-                    if self.score_type == 'rmse':
-                        score_val = rmse
-                    else:
-                        score_val = norm_rmse
-                except Exception as e:
-                    print("Exception occurred while building VAR model...")
-                    print(e)
-                    warnings.warn('    VAR model error: predictions not available.')
-
-            self.ml_dict[name]['model'] = model
-            self.ml_dict[name]['forecast'] = forecasts
-            self.ml_dict[name][self.score_type] = score_val
-            self.ml_dict[name]['model_build'] = model_build
-
-        if self.__any_contained_in_list(what_list=['ml', 'ML','best'], in_list=self.model_type):
-            ########## Let's build a Machine Learning Model now with Time Series Data ################
-
-            print("\n")
-            print("="*50)
-            print("Building ML Model")
-            print("="*50)
-            print("\n")
-
-            name = 'ML'
-            # Placeholder for cases when model can not be built
-            score_val = np.inf
-            model_build = None
-            model = None
-            forecasts = None
-            if lag <= 4:
-                lag = 4 ### set the minimum lags to be at least 4 for ML models
-            elif lag >= 10:
-                lag = 10 ### set the maximum lags to be not more than 10 for ML models
-            if len(preds) == 0:
-                print(colorful.BOLD + '\nNo predictors available. Skipping Machine Learning model...' + colorful.END)
-            else:
-                try:
-                    print(colorful.BOLD + '\nRunning Machine Learning Models...' + colorful.END)
-                    print('    Shifting %d predictors by lag=%d to align prior predictor with current target...'
-                                % (len(preds), lag))
-
-                    model_build = BuildML(
-                        scoring=self.score_type,
-                        forecast_period = self.forecast_period,
-                        verbose=self.verbose
-                    )
-
-                    # best = model_build.fit(ts_df=ts_df, target_col=target, lags=lag)
-                    model, forecasts, rmse, norm_rmse = model_build.fit(
-                        ts_df=ts_df,
-                        target_col=target,
-                        cv = cv,
-                        lags=lag
-                    )
-
-                    if self.score_type == 'rmse':
-                        score_val = rmse
-                    else:
-                        score_val = norm_rmse
-                    # bestmodel = best[0]
-
-                    # #### Plotting actual vs predicted for ML Model #################
-                    # # TODO: Move inside the Build Class
-                    # plt.figure(figsize=(5, 5))
-                    # plt.scatter(train.append(test)[target].values,
-                    #             np.r_[bestmodel.predict(train[preds]), bestmodel.predict(test[preds])])
-                    # plt.xlabel('Actual')
-                    # plt.ylabel('Predicted')
-                    # plt.show(block=False)
-                    # ############ Draw a plot of the Time Series data ######
-                    # time_series_plot(dfxs[target], chart_time=self.time_interval)
-
-                except Exception as e:
-                    print("Exception occurred while building ML model...")
-                    print(e)
-                    print('    For ML model, evaluation score is not available.')
-
-            self.ml_dict[name]['model'] = model
-            self.ml_dict[name]['forecast'] = forecasts
-            self.ml_dict[name][self.score_type] = score_val
-            self.ml_dict[name]['model_build'] = model_build
-
-        if not self.__all_contained_in_list(what_list=self.model_type, in_list=self.allowed_models):
-            print(f'The model_type should be any of the following: {self.allowed_models}. You entered {self.model_type}. Some models may not have been developed...')
-            if len(list(self.ml_dict.keys())) == 0:
+        ######################################################################################
+        ### Every model family is an independent training job. Build each one in its own
+        ### worker process and collect the results once they have all finished.
+        ######################################################################################
+        build_params = {
+            'forecast_period': self.forecast_period,
+            'time_interval': self.time_interval,
+            'score_type': self.score_type,
+            'verbose': self.verbose,
+            'conf_int': self.conf_int,
+            'holidays': self.holidays,
+            'growth': self.growth,
+            'seasonality': self.seasonality,
+            'seasonal_period': self.seasonal_period,
+            'ts_column': self.ts_column,
+            'stats_scoring': stats_scoring,
+            'p_max': p_max,
+            'd_max': d_max,
+            'q_max': q_max,
+            'lag': lag,
+            'd': None,
+            'n_jobs': self.n_jobs,
+            'successive_halving': self.successive_halving,
+        }
+
+        ### Estimate the order of differencing once and share it with the ARIMA based models.
+        ### With seasonality, auto_arima estimates d after seasonal differencing, so leave it to it.
+        self._d_hat = None
+        if not self._model_types.isdisjoint(_SARIMAX_KEYS) and not self.seasonality:
+            self._d_hat = _estimate_d(ts_df[target].values, ts_df[preds].values if preds else None,
+                                      max_d=d_max)
+            build_params['d'] = self._d_hat
+
+        ### The statistical models only need the target and preds. Select them once
+        ### here instead of making a copy of the columns for every model family.
+        ts_df_full = ts_df[[target]+preds]
+
+        active = [(name, builder, all_columns, len(preds) > 0 or not needs_preds)
+                  for name, keys, builder, all_columns, needs_preds in _MODEL_SPECS
+                  if not self._model_types.isdisjoint(keys)]
+        ### The cache key is a hash of the builder, the data and build_params. The data is hashed
+        ### here with _frame_key, before any model is built, instead of by joblib (see _frame_key)
+        run_job = _run_model_job
+        data_keys = {}
+        if self.cache_dir is not None:
+            run_job = Memory(self.cache_dir, verbose=0).cache(
+                _run_model_job, ignore=['log_level', 'collect_logs', 'ts_df'])
+            data_keys = {True: _frame_key(ts_df), False: _frame_key(ts_df_full)}
+        ### The workers do not have the handlers of this process, so they send their log
+        ### records back with the results and these are emitted here once all have finished
+        collect_logs = self.n_jobs != 1
+        jobs = [
+            delayed(run_job)(builder, logger.level, collect_logs, data_keys.get(all_columns),
+                             ts_df if all_columns else ts_df_full,
+                             target, preds, cv, build_params)
+            for _, builder, all_columns, runnable in active if runnable
+        ]
+        ### Arrays above max_nbytes (the data blocks of ts_df) are dumped once and shared
+        ### by the workers as read-only memory maps, smaller ones are simply pickled
+        outputs = Parallel(n_jobs=self.n_jobs, backend='loky',
+                           max_nbytes='1M', mmap_mode='r')(jobs)
+        for _, records in outputs:
+            for record in records:
+                logger.handle(record)
+        built = iter(result for result, _ in outputs)
+        ### Models that need preds are not built for a univariate series, but they are still
+        ### recorded (with an infinite score) so that they show up in the leaderboard
+        results = [next(built) if runnable else (name, None, None, np.inf, None)
+                   for name, _, _, runnable in active]
+        skipped = [name for name, _, _, runnable in active if not runnable]
+        if skipped:
+            logger.warning('No predictors available. Skipping %s model%s...'
+                        % (' and '.join(skipped), 's' if len(skipped) > 1 else ''))
+
+        self._add_results(results)
+
+        if not self._model_types.issubset(self._allowed_lower):
+            logger.warning(f'The model_type should be any of the following: {self.allowed_models}. You entered {self.model_type}. Some models may not have been developed...')
+            if not self.ml_dict:
                 return None
 
         ######## Selecting the best model based on the lowest rmse score ######
         best_model_name = self.get_best_model_name()
-        print(colorful.BOLD + '\nBest Model is: ' + colorful.END + best_model_name)
+        self._best_build = self.ml_dict[best_model_name].model_build
+        logger.info(colorful.BOLD + '\nBest Model is: ' + colorful.END + best_model_name)
 
-        best_model_dict = self.ml_dict[best_model_name]
-        if best_model_dict is not None:
-            cv_scores = best_model_dict.get(self.score_type)
-            mean_cv_score = self.__get_mean_cv_score(cv_scores)
-        print("    Best Model (Mean CV) Score: %0.2f" % mean_cv_score) #self.ml_dict[best_model_name][self.score_type])
+        mean_cv_score = self.__get_mean_cv_score(self.ml_dict[best_model_name].score)
+        logger.info("    Best Model (Mean CV) Score: %0.2f" % mean_cv_score) #self.ml_dict[best_model_name][self.score_type])
 
         end = time()
         elapsed = end-start
-        print("\n\n" + "-"*50)
-        print(f"Total time taken: {elapsed:.0f} seconds.")
-        print("-"*50 + "\n\n")
-        print("Leaderboard with best model on top of list:\n",self.get_leaderboard())
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n\n" + "-"*50)
+            logger.info(f"Total time taken: {elapsed:.0f} seconds.")
+            logger.info("-"*50 + "\n\n")
+            logger.info("Leaderboard with best model on top of list:\n%s", self.get_leaderboard())
         return self
 
+    def _add_results(self, results: List[Tuple]) -> None:
+        """
+        Stores the (name, model, forecasts, score_val, model_build) of each model family in
+        ml_dict, in order, and keeps _names, _scores (the mean CV scores) and the best model
+        up to date. The best model is the first one with the lowest score. A NaN score is
+        never the best.
+        """
+        self._names = [result[0] for result in results]
+        self._scores = np.full(len(results), np.inf)
+        for i, (name, model, forecasts, score_val, model_build) in enumerate(results):
+            self.ml_dict[name] = ModelEntry(model, forecasts, score_val, model_build, self.score_type)
+            mean_score = self._scores[i] = np.mean(score_val)
+            if mean_score < self._best_score:
+                self._best_score, self._best_name = float(mean_score), name
+
     def get_best_model_name(self) -> str:
         """
         Returns the best model name
         """
-        f1_stats = {}
-        for key, _ in self.ml_dict.items():
-            cv_scores = self.ml_dict[key][self.score_type]
-
-            # Standardize to a list
-            if isinstance(cv_scores, np.ndarray):
-                cv_scores = cv_scores.tolist()
-            if not isinstance(cv_scores, List):
-                cv_scores = [cv_scores]
-
-            f1_stats[key] = sum(cv_scores)/len(cv_scores)
-
-        best_model_name = min(f1_stats.items(), key=operator.itemgetter(1))[0]
-        return best_model_name
+        if self._best_name is None:
+            # e.g. all the scores are infinite: the first of the lowest ones (NaN sorts last)
+            return self._names[int(np.argsort(self._scores, kind='stable')[0])]
+        return self._best_name
 
     def get_best_model(self):
         """
         Returns the best model after training
         """
-        return self.ml_dict.get(self.get_best_model_name()).get('model')
+        return self.ml_dict[self.get_best_model_name()].model
 
     def get_model(self, model_name: str):
         """
         Returns the specified model
         """
-        if self.ml_dict.get(model_name) is not None:
-            return self.ml_dict.get(model_name).get('model')
+        if model_name in self.ml_dict:
+            return self.ml_dict[model_name].model
         else:
             print(f"Model with name '{model_name}' does not exist.")
             return None
@@ -744,14 +982,16 @@ class auto_timeseries:
         """
         Returns the best model after training
         """
-        return self.ml_dict.get(self.get_best_model_name()).get('model_build')
+        if self._best_build is not None:
+            return self._best_build
+        return self.ml_dict[self.get_best_model_name()].model_build
 
     def get_model_build(self, model_name: str):
         """
         Returns the specified model
         """
-        if self.ml_dict.get(model_name) is not None:
-            return self.ml_dict.get(model_name).get('model_build')
+        if model_name in self.ml_dict:
+            return self.ml_dict[model_name].model_build
         else:
             print(f"Model with name '{model_name}' does not exist.")
             return None
@@ -770,17 +1010,16 @@ class auto_timeseries:
         ):
         """
         Predict the results
+        The model builds are not refit here: the predictions come from the state that was
+        fitted (on the full data) at the end of fit(), so predict can be called repeatedly.
         """
 
         if isinstance(model, str):
-            if model == '':
-                bestmodel = self.get_best_model_build()
-            elif model.lower() == 'best':
+            if model == '' or model.lower() == 'best':
                 bestmodel = self.get_best_model_build()
             else:
-                if self.get_model_build(model) is not None:
-                    bestmodel = self.get_model_build(model)
-                else:
+                bestmodel = self.get_model_build(model)
+                if bestmodel is None:
                     print(f"(Error) Model of type '{model}' does not exist. No predictions will be made.")
                     return None
             self.model = bestmodel
@@ -829,38 +1068,21 @@ class auto_timeseries:
         """
         Returns the leaderboard after fitting
         """
-        names = []
-        mean_cv_scores = []
-        # std_cv_scores = [] # TODO: Add later
-        local_ml_dict = self.ml_dict
-        if local_ml_dict is not None:
-            model_names = list(local_ml_dict.keys())
-            if model_names != []:
-                for model_name in model_names:
-                    names.append(model_name)
-                    model_dict_single_model = local_ml_dict.get(model_name)
-                    if model_dict_single_model is not None:
-                        cv_scores = model_dict_single_model.get(self.score_type)
-                        mean_cv_score = self.__get_mean_cv_score(cv_scores)
-                        # if isinstance(cv_scores, float):
-                        #     mean_cv_score = cv_scores
-                        # else: # Assuming List
-                        #     mean_cv_score = sum(cv_scores)/len(cv_scores)
-                        mean_cv_scores.append(mean_cv_score)
-
-                results = pd.DataFrame({"name": names, self.score_type: mean_cv_scores})
-                results.sort_values(self.score_type, ascending=ascending, inplace=True)
-                return results
-            else:
-                return None
-        else:
+        if not self._names:
             return None
+        # The index is the position of the model in ml_dict, and NaN scores are last
+        # either way, as with DataFrame.sort_values
+        order = np.argsort(self._scores if ascending else -self._scores, kind='stable')
+        return pd.DataFrame({"name": [self._names[i] for i in order], self.score_type: self._scores[order]},
+                            index=order)
 
     def plot_cv_scores(self, **kwargs):
         """
         Plots a boxplot of the cross validation scores for the various models.
         **kwargs: Keyword arguments to be passed to the seaborn boxplot call
         """
+        import seaborn as sns  # type: ignore
+        _configure_plot_style()
         cv_df = self.get_cv_scores()
         ax = sns.boxplot(x="Model", y="CV Scores", data=cv_df, **kwargs)
         return ax
@@ -870,12 +1092,9 @@ class auto_timeseries:
         Return a tidy data frame with the CV scores across all models
         :rtype pandas.DataFrame
         """
-        cv_df = pd.DataFrame(columns=['Model', 'CV Scores'])
-        for model in self.ml_dict.keys():
-            rmses = self.ml_dict.get(model).get("rmse")
-            new_row = {'Model':model, 'CV Scores':rmses}
-            cv_df = cv_df.append(new_row, ignore_index=True)
-            # print(f"Model: {model} RMSEs: {rmses}")
+        cv_df = pd.DataFrame([{'Model': model, 'CV Scores': entry.score}
+                              for model, entry in self.ml_dict.items()],
+                             columns=['Model', 'CV Scores'])
         cv_df = cv_df.explode('CV Scores').reset_index(drop=True)
         cv_df = cv_df.astype({"CV Scores": float})
         return cv_df
@@ -890,30 +1109,11 @@ class auto_timeseries:
         else: # Assuming List
             mean_cv_score = sum(cv_scores)/len(cv_scores)
         return mean_cv_score
-
-    def __any_contained_in_list(self, what_list: List[str], in_list: List[str], lower: bool = True) -> bool:
-        """
-        Returns True is any element in the 'in_list' is contained in the 'what_list'
-        """
-        if lower:
-            what_list = [elem.lower() for elem in what_list]
-            in_list = [elem.lower() for elem in in_list]
-
-        return any([True if elem in in_list else False for elem in what_list])
-
-    def __all_contained_in_list(self, what_list: List[str], in_list: List[str], lower: bool = True) -> bool:
-        """
-        Returns True is all elements in the 'in_list' are contained in the 'what_list'
-        """
-        if lower:
-            what_list = [elem.lower() for elem in what_list]
-            in_list = [elem.lower() for elem in in_list]
-
-        return all([True if elem in in_list else False for elem in what_list])
 #################################################################################
+### Logged instead of printed: the worker processes import auto_ts again and would repeat it
 module_type = 'Running' if  __name__ == "__main__" else 'Imported'
 version_number = '0.0.26'
-print(f"""{module_type} auto_timeseries version:{version_number}. Call by using:
+logger.info(f"""{module_type} auto_timeseries version:{version_number}. Call by using:
 model = auto_timeseries(score_type='rmse', forecast_period=forecast_period,
                 time_interval='Month',
                 non_seasonal_pdq=None, seasonality=False, seasonal_period=12,
@@ -1,5 +1,21 @@
+import sys
+
 from .build_base import BuildBase
 from .ar_based import BuildArima, BuildSarimax, BuildAutoSarimax, BuildVAR
 from .build_ml import BuildML
-from .build_prophet import BuildProphet
 from .build_pyflux import build_pyflux_model
+
+
+def __getattr__(name):
+    """
+    BuildProphet is imported on first access since importing fbprophet is slow.
+    Module level __getattr__ (PEP 562) needs python 3.7, older versions import it right away below.
+    """
+    if name == 'BuildProphet':
+        from .build_prophet import BuildProphet
+        return BuildProphet
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if sys.version_info < (3, 7):
+    from .build_prophet import BuildProphet
@@ -0,0 +1,177 @@
+"""Exact ARMA likelihood using the innovations algorithm
+
+This is a fast alternative to the state space (Kalman filter) likelihood of statsmodels
+that is used by BuildArima(engine='numba') while searching for the best (p, d, q) order.
+See Brockwell & Davis, Introduction to Time Series and Forecasting, sections 3.3 and 5.2.
+Params are laid out as in statsmodels ARIMA: [const, ar.L1..ar.Lp, ma.L1..ma.Lq] where
+const is the mean of the (differenced) series. The innovations variance is concentrated
+out of the likelihood.
+"""
+
+import math
+
+import numpy as np  # type: ignore
+from scipy.optimize import minimize  # type: ignore
+
+from ...utils.jit import njit
+
+
+@njit(cache=True, fastmath=True)
+def _arma_autocovariance(phi, theta, n_lags):
+    """
+    Autocovariances gamma(0..n_lags) of an ARMA process with unit innovations variance
+    """
+    p = phi.shape[0]
+    q = theta.shape[0]
+    # psi weights of the MA(infinity) representation, only needed up to lag q
+    psi = np.zeros(q + 1)
+    psi[0] = 1.0
+    for j in range(1, q + 1):
+        psi[j] = theta[j - 1]
+        for i in range(1, min(j, p) + 1):
+            psi[j] += phi[i - 1] * psi[j - i]
+    # c[k] = sum_{j=k..q} theta_j * psi_{j-k} with theta_0 = 1
+    c = np.zeros(max(p, q) + 1)
+    for k in range(q + 1):
+        for j in range(k, q + 1):
+            theta_j = 1.0 if j == 0 else theta[j - 1]
+            c[k] += theta_j * psi[j - k]
+    # gamma(0..p) solve a linear system, the rest follows from the AR recursion
+    a = np.eye(p + 1)
+    for k in range(p + 1):
+        for j in range(1, p + 1):
+            a[k, abs(k - j)] -= phi[j - 1]
+    gamma = np.zeros(max(n_lags, p) + 1)
+    gamma[:p + 1] = np.linalg.solve(a, c[:p + 1].copy())
+    for k in range(p + 1, gamma.shape[0]):
+        value = c[k] if k <= q else 0.0
+        for j in range(1, p + 1):
+            value += phi[j - 1] * gamma[k - j]
+        gamma[k] = value
+    return gamma
+
+
+@njit(cache=True, fastmath=True)
+def _kappa(i, j, gamma, phi, theta, m):
+    """
+    Covariance of the transformed process W (Brockwell & Davis, eq. 3.3.8)
+    """
+    if i > j:
+        i, j = j, i
+    h = j - i
+    if j <= m:
+        return gamma[h]
+    if i <= m:
+        if j > 2 * m:
+            return 0.0
+        value = gamma[h]
+        for r in range(1, phi.shape[0] + 1):
+            value -= phi[r - 1] * gamma[abs(r - h)]
+        return value
+    q = theta.shape[0]
+    value = 0.0
+    for r in range(q + 1 - h):
+        theta_r = 1.0 if r == 0 else theta[r - 1]
+        theta_rh = 1.0 if r + h == 0 else theta[r + h - 1]
+        value += theta_r * theta_rh
+    return value
+
+
+@njit(cache=True, fastmath=True)
+def _arma_innov_loglike(params, y, p, q):
+    """
+    Exact Gaussian log-likelihood of an ARMA(p, q) with mean params[0] and the innovations
+    variance concentrated out. Only the last max(p, q) innovations coefficients are needed
+    at each step, so this is a single O(n * max(p, q)^2) pass over y.
+    """
+    n = y.shape[0]
+    x = y - params[0]
+    phi = params[1:1 + p]
+    theta = params[1 + p:1 + p + q]
+    m = max(p, q)
+    gamma = _arma_autocovariance(phi, theta, 2 * m + p + 1)
+
+    theta_n = np.zeros((n, m + 1))
+    v = np.zeros(n)
+    v[0] = _kappa(1, 1, gamma, phi, theta, m)
+    for t in range(1, n):
+        start = max(0, t - m)
+        for k in range(start, t):
+            value = _kappa(t + 1, k + 1, gamma, phi, theta, m)
+            for j in range(start, k):
+                value -= theta_n[k, k - j] * theta_n[t, t - j] * v[j]
+            theta_n[t, t - k] = value / v[k]
+        value = _kappa(t + 1, t + 1, gamma, phi, theta, m)
+        for j in range(start, t):
+            value -= theta_n[t, t - j] ** 2 * v[j]
+        v[t] = value
+
+    sum_squares = 0.0
+    sum_log_v = 0.0
+    innovations = np.zeros(n)
+    for t in range(n):
+        if v[t] <= 0.0:
+            return -1e300
+        x_hat = 0.0
+        if t < m:
+            for j in range(1, t + 1):
+                x_hat += theta_n[t, j] * innovations[t - j]
+        else:
+            for r in range(1, p + 1):
+                x_hat += phi[r - 1] * x[t - r]
+            for j in range(1, q + 1):
+                x_hat += theta_n[t, j] * innovations[t - j]
+        innovations[t] = x[t] - x_hat
+        sum_squares += innovations[t] ** 2 / v[t]
+        sum_log_v += math.log(v[t])
+    sigma2 = sum_squares / n
+    return -0.5 * n * (math.log(2.0 * math.pi * sigma2) + 1.0) - 0.5 * sum_log_v
+
+
+@njit(cache=True, fastmath=True)
+def _constrain_arma(uparams, p, q):
+    """
+    Maps unconstrained params to a stationary AR and an invertible MA polynomial, the same
+    transformation as transparams=True in statsmodels ARIMA (Jones, 1980)
+    """
+    params = uparams.copy()
+    for offset, k, sign in ((1, p, -1.0), (1 + p, q, 1.0)):
+        new = np.tanh(uparams[offset:offset + k] / 2.0)
+        tmp = new.copy()
+        for j in range(1, k):
+            a = new[j]
+            for kiter in range(j):
+                tmp[kiter] += sign * a * new[j - kiter - 1]
+            new[:j] = tmp[:j]
+        params[offset:offset + k] = new
+    return params
+
+
+def _negative_loglike(uparams, y, p, q):
+    return -_arma_innov_loglike(_constrain_arma(uparams, p, q), y, p, q)
+
+
+def fit_arma_innovations(y, p, d, q, start_params=None):
+    """
+    Fits an ARIMA(p, d, q) with L-BFGS-B on the innovations likelihood.
+    start_params are unconstrained params (as returned here) of the same length, e.g.
+    from a smaller model padded with zeros.
+    Returns a dictionary with the unconstrained and constrained params, llf, aic, bic and hqic
+    """
+    y = np.ascontiguousarray(np.diff(np.asarray(y, dtype=float), n=d))
+    if start_params is None:
+        start_params = np.zeros(1 + p + q)
+        start_params[0] = y.mean()
+    results = minimize(_negative_loglike, np.asarray(start_params, dtype=float),
+                       args=(y, p, q), method='L-BFGS-B')
+    llf = -results.fun
+    nobs = y.shape[0]
+    k = 2 + p + q  # const, ar, ma and the innovations variance
+    return {
+        'uparams': results.x,
+        'params': _constrain_arma(results.x, p, q),
+        'llf': llf,
+        'aic': -2 * llf + 2 * k,
+        'bic': -2 * llf + k * np.log(nobs),
+        'hqic': -2 * llf + 2 * k * np.log(np.log(nobs)),
+    }
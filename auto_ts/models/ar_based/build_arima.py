@@ -8,24 +8,50 @@ import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 from pandas.core.generic import NDFrame # type:ignore
 
-import matplotlib.pyplot as plt  # type: ignore
-import seaborn as sns  # type: ignore
-sns.set(style="white", color_codes=True)
-
 # imported ARIMA from statsmodels pkg
 from statsmodels.tsa.arima_model import ARIMA # type: ignore
 
 # helper functions
 from ...utils import print_static_rmse, print_dynamic_rmse
-from ...models.ar_based.param_finder import find_lowest_pq
+from ...models.ar_based.param_finder import find_lowest_pq, find_lowest_pq_stepwise, _initial_order
+from ...models.ar_based.arma_likelihood import fit_arma_innovations
+from ...utils.jit import HAS_NUMBA
+from ...utils.plotting import _configure_plot_style
 import pdb
 
 
+def _warm_start_arma_params(params_cache, p_val, q_val):
+    """
+    Returns start_params for an ARIMA(p, d, q) from the nearest smaller model in params_cache,
+    which maps (p, q) to the fitted params laid out as [const, ar.L1..ar.Lp, ma.L1..ma.Lq].
+    New AR and MA lags are padded with zeros.
+    """
+    for key in ((p_val, q_val-1), (p_val-1, q_val), (p_val-1, q_val-1)):
+        cached = params_cache.get(key)
+        if cached is not None:
+            k_ar, k_ma = key
+            start_params = np.zeros(1 + p_val + q_val)
+            start_params[0] = cached[0]
+            start_params[1:1+k_ar] = cached[1:1+k_ar]
+            start_params[1+p_val:1+p_val+k_ma] = cached[1+k_ar:1+k_ar+k_ma]
+            return start_params
+    return None
+
+
 class BuildArima():
-    def __init__(self, metric='aic', p_max=3, d_max=1, q_max=3, forecast_period=2, method='mle', verbose=0):
+    def __init__(self, metric='aic', p_max=3, d_max=1, q_max=3, forecast_period=2, method='mle', verbose=0, stepwise=True, engine='statsmodels', d=None):
         """
         Automatically build an ARIMA Model
+        If stepwise is True (default), the (p, q) orders for each d are found with the
+        Hyndman-Khandakar stepwise search instead of fitting the full grid.
+        If engine is 'numba', the models fit during the order search use a numba compiled
+        innovations algorithm likelihood instead of statsmodels (needs numba to be installed).
+        The best model is always fit with statsmodels.
+        If d is given (e.g. from a KPSS test), only that order of differencing is searched.
         """
+        if engine == 'numba' and not HAS_NUMBA:
+            print('numba is not installed. Using statsmodels to search the ARIMA orders...')
+            engine = 'statsmodels'
         self.metric = metric
         self.p_max = p_max
         self.d_max = d_max
@@ -33,6 +59,9 @@ class BuildArima():
         self.forecast_period = forecast_period
         self.method = method
         self.verbose = verbose
+        self.stepwise = stepwise
+        self.engine = engine
+        self.d = d
         self.model = None
 
     def fit(self, ts_df):
@@ -75,21 +104,40 @@ class BuildArima():
         #########################################################################
         if ts_train.dtype == 'int64':
             ts_train = ts_train.astype(float)
-        for d_val in range(d_min, self.d_max+1):
+        d_values = range(d_min, self.d_max+1) if self.d is None else [self.d]
+        for d_val in d_values:
             print('\nDifferencing = %d' % d_val)
             results_bic = pd.DataFrame(
                 index=['AR{}'.format(i) for i in range(p_min, self.p_max+1)],
                 columns=['MA{}'.format(i) for i in range(q_min, self.q_max+1)]
             )
-            for p_val, q_val in itertools.product(range(p_min, self.p_max+1), range(q_min, self.q_max+1)):
+            # Fitted params for this d, used to warm start the next bigger (p, q) model
+            params_cache = {}
+
+            def fit_order(p_val, q_val):
                 if p_val == 0 and d_val == 0 and q_val == 0:
-                    results_bic.loc['AR{}'.format(p_val), 'MA{}'.format(q_val)] = np.nan
-                    continue
-                else:
+                    return np.nan
+                if self.engine == 'numba' and self.metric in ('aic', 'bic', 'hqic', 'llf'):
+                    results = fit_arma_innovations(ts_train.values, p_val, d_val, q_val,
+                                                   _warm_start_arma_params(params_cache, p_val, q_val))
+                    params_cache[(p_val, q_val)] = results['uparams']
+                    return results[self.metric]
+                model = ARIMA(ts_train, order=(p_val, d_val, q_val))
+                results = model.fit(start_params=_warm_start_arma_params(params_cache, p_val, q_val),
+                                    transparams=False, method=self.method, solver=solver, disp=False)
+                params_cache[(p_val, q_val)] = np.asarray(results.params)
+                return getattr(results, self.metric)
+
+            if self.stepwise:
+                start_order = _initial_order(np.diff(ts_train.values, n=d_val), self.p_max, self.q_max)
+                metrics = find_lowest_pq_stepwise(fit_order, self.p_max, self.q_max, start_order=start_order)
+                iteration += len(metrics)
+                print(' Stepwise search fit %d of %d models...' % (len(metrics), (self.p_max+1)*(self.q_max+1)))
+            else:
+                metrics = {}
+                for p_val, q_val in itertools.product(range(p_min, self.p_max+1), range(q_min, self.q_max+1)):
                     try:
-                        model = ARIMA(ts_train, order=(p_val, d_val, q_val))
-                        results = model.fit(transparams=False, method=self.method, solver=solver, disp=False)
-                        results_bic.loc['AR{}'.format(p_val), 'MA{}'.format(q_val)] = eval('results.' + self.metric)
+                        metrics[(p_val, q_val)] = fit_order(p_val, q_val)
                         if iteration % 10 == 0:
                             print(' Iteration %d completed...' % iteration)
                         iteration += 1
@@ -99,10 +147,15 @@ class BuildArima():
                     except:
                         iteration += 1
                         continue
+            for (p_val, q_val), metric_value in metrics.items():
+                results_bic.loc['AR{}'.format(p_val), 'MA{}'.format(q_val)] = metric_value
             results_bic = results_bic[results_bic.columns].astype(float)
             interim_d = copy.deepcopy(d_val)
             interim_p, interim_q, interim_bic = find_lowest_pq(results_bic)
             if self.verbose == 1:
+                import matplotlib.pyplot as plt  # type: ignore
+                import seaborn as sns  # type: ignore
+                _configure_plot_style()
                 _, ax = plt.subplots(figsize=(20, 10))
                 ax = sns.heatmap(results_bic,
                                 mask=results_bic.isnull(),
@@ -136,6 +189,8 @@ class BuildArima():
             end_date = ts_df.index[-1]
             pred_dynamic = self.model.predict(start=start_date, end=end_date, dynamic=True)
             if self.verbose == 1:
+                import matplotlib.pyplot as plt  # type: ignore
+                _configure_plot_style()
                 ax = concatenated[['original', 'predicted']][best_d:].plot()
                 pred_dynamic.plot(label='Dynamic Forecast', ax=ax, figsize=(15, 5))
                 print('Dynamic %d-period Forecasts:' % (self.forecast_period,))
@@ -166,6 +221,8 @@ class BuildArima():
             pred_dynamic.sort_index(inplace=True)
             print('\nDynamic %d-period Forecasts:' % self.forecast_period)
             if self.verbose == 1:
+                import matplotlib.pyplot as plt  # type: ignore
+                _configure_plot_style()
                 ax = concatenated.plot()
                 pred_dynamic.plot(label='Dynamic Forecast', ax=ax, figsize=(15, 5))
                 ax.set_xlabel('Date')
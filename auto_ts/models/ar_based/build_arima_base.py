@@ -1,6 +1,5 @@
 from typing import Optional
 import warnings
-warnings.filterwarnings(action='ignore')
 from abc import abstractmethod
 import copy
 
@@ -8,8 +7,6 @@ import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 from pandas.core.generic import NDFrame # type:ignore
 
-import matplotlib.pyplot as plt # type: ignore
-
 from tscv import GapWalkForward # type: ignore
 
 # imported SARIMAX from statsmodels pkg
@@ -23,11 +20,14 @@ from ...models.ar_based.param_finder import find_best_pdq_or_PDQ
 
 
 class BuildArimaBase(BuildBase):
-    def __init__(self, scoring, seasonality=False, seasonal_period=None, p_max=12, d_max=2, q_max=12, forecast_period=2, verbose=0):
+    def __init__(self, scoring, seasonality=False, seasonal_period=None, p_max=12, d_max=2, q_max=12, forecast_period=2, verbose=0, stepwise=True, d=None):
         """
         Base class for building any ARIMA model
         Definitely applicable to SARIMAX and auto_arima with seasonality
         Check later if same can be reused for ARIMA (most likely yes)
+        stepwise: If True (default), search the (p, q) orders stepwise (Hyndman-Khandakar)
+        instead of fitting the full grid
+        d: Order of differencing if it is already known (e.g. from a KPSS test), else it is searched
         """
         super().__init__(
             scoring=scoring,
@@ -40,6 +40,8 @@ class BuildArimaBase(BuildBase):
         self.p_max = p_max
         self.d_max = d_max
         self.q_max = q_max
+        self.stepwise = stepwise
+        self.d = d
 
         self.best_p = None
         self.best_d = None
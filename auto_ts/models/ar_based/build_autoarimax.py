@@ -3,11 +3,6 @@ import pdb
 import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 
-# TODO: Resolve which one we want to use
-#from pmdarima.arima.auto import auto_arima # type: ignore
-from pmdarima.arima import auto_arima # type: ignore
-
-
 from .build_arima_base import BuildArimaBase
 
 # helper functions
@@ -21,6 +16,10 @@ class BuildAutoSarimax(BuildArimaBase):
         """
         Given a dataset, finds the best parameters using the settings in the class
         """
+        # pmdarima is imported here since it loads matplotlib.pyplot
+        # TODO: Resolve which one we want to use
+        #from pmdarima.arima.auto import auto_arima # type: ignore
+        from pmdarima.arima import auto_arima # type: ignore
 
         if self.verbose >= 1:
             print(colorful.BOLD + '\n    Finding the best parameters using AutoArima:' + colorful.END)
@@ -38,10 +37,10 @@ class BuildAutoSarimax(BuildArimaBase):
             scoring='mse', # only supports 'mse' or 'mae'
 
             # TODO: Check if we can go higher on max p and q (till seasonality)
-            start_p=0, d=None, start_q=0, max_p=self.p_max, max_d=self.d_max, max_q=self.q_max, # AR Parameters
+            start_p=0, d=self.d, start_q=0, max_p=self.p_max, max_d=self.d_max, max_q=self.q_max, # AR Parameters
             start_P=0, D=None, start_Q=0, max_P=self.p_max, max_D=self.d_max, max_Q=self.q_max, # Seasonal Parameters (1)
             m=self.seasonal_period, seasonal=self.seasonality, # Seasonal Parameters (2)
-            stepwise = True, random_state=42, n_fits = 50, n_jobs=1,  # Hyperparameer Search
+            stepwise = self.stepwise, random_state=42, n_fits = 50, n_jobs=1,  # Hyperparameer Search
             error_action='warn', trace = True, supress_warnings=True
         )
         
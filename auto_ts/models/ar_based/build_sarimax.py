@@ -2,8 +2,6 @@ import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 from pandas.core.generic import NDFrame # type:ignore
 
-import matplotlib.pyplot as plt # type: ignore
-
 from tscv import GapWalkForward # type: ignore
 
 # imported SARIMAX from statsmodels pkg
@@ -249,7 +247,9 @@ class BuildSarimax(BuildArimaBase):
                 non_seasonal_pdq=None,
                 seasonal_period=None,
                 seasonality=False,
-                verbose=self.verbose
+                verbose=self.verbose,
+                stepwise=self.stepwise,
+                d=self.d
             )
 
             if self.verbose >= 1:
@@ -269,7 +269,9 @@ class BuildSarimax(BuildArimaBase):
                 non_seasonal_pdq=None,  # we need to figure this out ...
                 seasonal_period=None,
                 seasonality=False,  # setting seasonality = False for p, d, q
-                verbose=self.verbose
+                verbose=self.verbose,
+                stepwise=self.stepwise,
+                d=self.d
             )
 
             if self.verbose >= 1:
@@ -284,7 +286,8 @@ class BuildSarimax(BuildArimaBase):
                 non_seasonal_pdq=(self.best_p, self.best_d, self.best_q), # found previously ...
                 seasonal_period=self.seasonal_period,  # passing seasonal period
                 seasonality=True,  # setting seasonality = True for P, D, Q
-                verbose=self.verbose
+                verbose=self.verbose,
+                stepwise=self.stepwise
             )
 
             if self.seasonality:
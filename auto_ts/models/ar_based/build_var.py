@@ -11,16 +11,13 @@ import numpy as np  # type: ignore
 import pandas as pd # type: ignore
 from pandas.core.generic import NDFrame # type:ignore
 
-import matplotlib.pyplot as plt # type: ignore
-import seaborn as sns # type: ignore
-sns.set(style="white", color_codes=True)
-
 from statsmodels.tsa.statespace.varmax import VARMAX # type: ignore
 
 from tscv import GapWalkForward # type: ignore
 
 # helper functions
 from ...utils import print_dynamic_rmse
+from ...utils.plotting import _configure_plot_style
 from ...models.ar_based.param_finder import find_lowest_pq
 from ..build_base import BuildBase
 
@@ -28,7 +25,8 @@ from ..build_base import BuildBase
 class BuildVAR(BuildBase):
     """Class to build a VAR model
     """
-    def __init__(self, scoring, forecast_period=2, p_max=3, q_max=3, verbose=0):
+    def __init__(self, scoring, forecast_period=2, p_max=3, q_max=3, verbose=0,
+                 early_stop=False, early_stop_rounds=3):
         """
         Automatically build a VAR Model
 
@@ -36,6 +34,9 @@ class BuildVAR(BuildBase):
         on. You can give it any of the following metrics as scoring options:
             AIC, BIC, Deviance, Log-likelihood.
         You can give the highest order values for p and q. Default is set to 3 for both.
+        If early_stop is True, the (p, q) search for a variable stops once early_stop_rounds
+        successive fits have not improved the metric. This may miss the best (p, q), so it is off
+        by default and every (p, q) up to (p_max, q_max) is fit.
         """
         super().__init__(
             scoring=scoring,
@@ -44,6 +45,8 @@ class BuildVAR(BuildBase):
         )
         self.p_max = p_max
         self.q_max = q_max
+        self.early_stop = early_stop
+        self.early_stop_rounds = early_stop_rounds
         self.best_p = None
         self.best_d = None
         self.best_q = None
@@ -205,7 +208,14 @@ class BuildVAR(BuildBase):
                 index=['AR{}'.format(i) for i in range(0, self.p_max+1)],
                 columns=['MA{}'.format(i) for i in range(0, self.q_max+1)]
             )
-            for p_val, q_val in itertools.product(range(0, self.p_max+1), range(0, self.q_max+1)):
+            # Smaller (and usually better) orders are tried first so that the early stop
+            # skips the larger models, which are also the most expensive ones to fit
+            orders = sorted(itertools.product(range(0, self.p_max+1), range(0, self.q_max+1)), key=sum)
+            best, stale = np.inf, 0
+            for p_val, q_val in orders:
+                if self.early_stop and stale >= self.early_stop_rounds:
+                    print(' Stopping early: no improvement in the last %d iterations' % stale)
+                    break
                 if p_val == 0 and q_val == 0:
                     info_criteria.loc['AR{}'.format(p_val), 'MA{}'.format(q_val)] = np.nan
                     print(' Iteration %d completed' % i)
@@ -214,7 +224,12 @@ class BuildVAR(BuildBase):
                     try:
                         model = VARMAX(y_train, order=(p_val, q_val), trend='c')
                         model = model.fit(max_iter=1000, disp=False)
-                        info_criteria.loc['AR{}'.format(p_val), 'MA{}'.format(q_val)] = eval('model.' + self.scoring)
+                        score_val = eval('model.' + self.scoring)
+                        info_criteria.loc['AR{}'.format(p_val), 'MA{}'.format(q_val)] = score_val
+                        if score_val < best:
+                            best, stale = score_val, 0
+                        else:
+                            stale += 1
                         print(' Iteration %d completed' % i)
                         i += 1
                     except Exception:
@@ -224,6 +239,9 @@ class BuildVAR(BuildBase):
             interim_d = copy.deepcopy(d_val)
             interim_p, interim_q, interim_bic = find_lowest_pq(info_criteria)
             if self.verbose == 1:
+                import matplotlib.pyplot as plt  # type: ignore
+                import seaborn as sns  # type: ignore
+                _configure_plot_style()
                 _, axis = plt.subplots(figsize=(20, 10))
                 axis = sns.heatmap(
                     info_criteria,
@@ -3,15 +3,12 @@ import pandas as pd # type: ignore
 import itertools
 import operator
 import copy
-import matplotlib.pyplot as plt # type: ignore
-import seaborn as sns # type: ignore
-# This gives an error when running from a python script. 
-# Maybe, this should be set in the jupyter notebook directly.
-# get_ipython().magic('matplotlib inline')
-sns.set(style="white", color_codes=True)
 # imported SARIMAX from statsmodels pkg for find_best_pdq_or_PDQ
 from statsmodels.tsa.statespace.sarimax import SARIMAX  # type: ignore
 
+from ...utils.jit import njit, prange
+from ...utils.plotting import _configure_plot_style
+
 
 def find_lowest_pq(df):
     """
@@ -36,8 +33,138 @@ def find_lowest_pq(df):
     return ar_p, ma_q, lowest_bic
 
 
+@njit(cache=True, fastmath=True, parallel=True)
+def _acf(y, nlags):
+    """
+    Sample autocorrelations of y for lags 0..nlags
+    """
+    n = y.shape[0]
+    ybar = y.mean()
+    denom = ((y - ybar) ** 2).sum()
+    acf = np.ones(nlags + 1)
+    for k in prange(1, nlags + 1):
+        total = 0.0
+        for t in range(n - k):
+            total += (y[t] - ybar) * (y[t + k] - ybar)
+        acf[k] = total / denom
+    return acf
+
+
+@njit(cache=True, fastmath=True)
+def _pacf(acf):
+    """
+    Partial autocorrelations from the autocorrelations (Durbin-Levinson recursion)
+    """
+    nlags = acf.shape[0] - 1
+    pacf = np.ones(nlags + 1)
+    phi = np.zeros(nlags + 1)
+    prev = np.zeros(nlags + 1)
+    for k in range(1, nlags + 1):
+        num = acf[k]
+        den = 1.0
+        for j in range(1, k):
+            num -= prev[j] * acf[k - j]
+            den -= prev[j] * acf[j]
+        phi[k] = num / den
+        for j in range(1, k):
+            phi[j] = prev[j] - phi[k] * prev[k - j]
+        pacf[k] = phi[k]
+        prev[:] = phi
+    return pacf
+
+
+def _initial_order(y, p_max, q_max):
+    """
+    Finds a seed (p, q) for the stepwise search from the ACF and PACF of a (differenced)
+    series: p is the number of leading significant partial autocorrelations and q the
+    number of leading significant autocorrelations (outside +/-1.96/sqrt(n)).
+    Returns None if the series is too short or constant (e.g. a linear trend after differencing).
+    """
+    y = np.ascontiguousarray(y, dtype=float)
+    nlags = max(p_max, q_max)
+    if nlags == 0 or y.shape[0] <= nlags + 1 or np.ptp(y) == 0:
+        return None
+    acf = _acf(y, nlags)
+    pacf = _pacf(acf)
+    bound = 1.96 / np.sqrt(y.shape[0])
+    p_val = 0
+    while p_val < p_max and abs(pacf[p_val + 1]) > bound:
+        p_val += 1
+    q_val = 0
+    while q_val < q_max and abs(acf[q_val + 1]) > bound:
+        q_val += 1
+    return p_val, q_val
+
+
+def find_lowest_pq_stepwise(fit_order, p_max, q_max, max_steps=100, start_order=None):
+    """
+    This is the stepwise search of Hyndman & Khandakar (2008) that is used by auto.arima.
+    Instead of fitting every (p, q) combination up to (p_max, q_max), it fits a few seed
+    models and then only tries the neighbours of the best model found so far, i.e. the
+    orders that differ by +/-1 in p and/or q. It moves to the first neighbour that lowers
+    the metric and stops when none of the neighbours does.
+
+    fit_order is a function that takes (p, q) and returns the eval metric of that model
+    (lower is better). It can raise or return NaN if the model can not be fit.
+    start_order is an optional extra seed, e.g. from the ACF/PACF (see _initial_order).
+    Returns a dictionary of (p, q) -> metric for every order that was fit. Orders are
+    never fit twice even when the neighbourhoods of two steps overlap.
+    """
+    fitted = {}
+
+    def evaluate(order):
+        if order not in fitted:
+            try:
+                fitted[order] = float(fit_order(*order))
+            except Exception:
+                fitted[order] = np.nan
+        return fitted[order]
+
+    seeds = [(2, 2), (0, 0), (1, 0), (0, 1)]
+    if start_order is not None:
+        seeds.insert(0, start_order)
+    best_order = None
+    for p_val, q_val in seeds:
+        order = (min(p_val, p_max), min(q_val, q_max))
+        value = evaluate(order)
+        if np.isfinite(value) and (best_order is None or value < fitted[best_order]):
+            best_order = order
+    if best_order is None:
+        return fitted
+
+    neighbours = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, 1), (-1, 1), (1, -1)]
+    for _ in range(max_steps):
+        improved = False
+        for delta_p, delta_q in neighbours:
+            order = (best_order[0] + delta_p, best_order[1] + delta_q)
+            if not (0 <= order[0] <= p_max and 0 <= order[1] <= q_max) or order in fitted:
+                continue
+            value = evaluate(order)
+            if np.isfinite(value) and value < fitted[best_order]:
+                best_order = order
+                improved = True
+                break
+        if not improved:
+            break
+    return fitted
+
+
+def get_warm_start_params(params_cache, p_val, q_val, param_names):
+    """
+    Returns start_params for a (p, q) model using the params of the nearest smaller model
+    that was already fit, or None if there is no such model. params_cache maps (p, q) to a
+    dictionary of {param_name: value}. Params that are new in the bigger model start at 0.
+    """
+    for key in ((p_val, q_val-1), (p_val-1, q_val), (p_val-1, q_val-1)):
+        cached = params_cache.get(key)
+        if cached is not None:
+            return np.array([cached.get(name, 0.0) for name in param_names])
+    return None
+
+
 def find_best_pdq_or_PDQ(ts_df, scoring, p_max, d_max, q_max, non_seasonal_pdq,
-                         seasonal_period, seasonality=False, verbose=0):
+                         seasonal_period, seasonality=False, verbose=0, stepwise=True, d=None,
+                         warm_start=False):
     p_min = 0
     d_min = 0
     q_min = 0
@@ -49,55 +176,87 @@ def find_best_pdq_or_PDQ(ts_df, scoring, p_max, d_max, q_max, non_seasonal_pdq,
     iteration = 0
     results_dict = {}
     seasonality_dict = {}
-    for d_val in range(d_min, d_max+1):
+    # Only search the given order of differencing if it is already known
+    d_values = range(d_min, d_max+1) if d is None else [d]
+    for d_val in d_values:
         print(f"\nDifferencing = {d_val} with Seasonality = {seasonality}")
         results_bic = pd.DataFrame(index=['AR{}'.format(i) for i in range(p_min, p_max+1)],
                                    columns=['MA{}'.format(i) for i in range(q_min, q_max+1)])
-        for p_val, q_val in itertools.product(range(p_min,p_max+1), range(q_min, q_max+1)):
+
+        # Params of the models that were fit for this d, keyed on (p, q) or on (P, Q) when
+        # searching the seasonal orders. With warm_start they are used as the start params of the
+        # next bigger model. This is off by default: without the stationarity and invertibility
+        # constraints the likelihood has several optima, so the warm started fits can settle on
+        # other ones than the cold fits and change the selected order.
+        params_cache = {}
+
+        def fit_order(p_val, q_val):
             if p_val == 0 and d_val == 0 and q_val == 0:
-                results_bic.loc['AR{}'.format(p_val), 'MA{}'.format(q_val)] = np.nan
-                continue
-            try:
-                if seasonality:
-                    # In order to get forecasts to be in the same value ranges of the
-                    # orig_endogs, you must set the simple_differencing = False and
-                    # the start_params to be the same as ARIMA.
-                    # That is the only way to ensure that the output of this
-                    # model is comparable to other ARIMA models
-                    
-                    model = SARIMAX(
-                        ts_df,
-                        order=(ns_p, ns_d, ns_q),
-                        seasonal_order=(p_val, d_val, q_val, seasonal_period),
-                        enforce_stationarity=False,
-                        enforce_invertibility=False,
-                        trend='ct',
-                        start_params=[0, 0, 0, 1],
-                        simple_differencing=False
-                    )
-                else:
-                    model = SARIMAX(
-                        ts_df,
-                        order=(p_val, d_val, q_val),
-                        enforce_stationarity=False,
-                        enforce_invertibility=False,
-                        trend='ct',
-                        start_params=[0, 0, 0, 1],
-                        simple_differencing=False
-                    )
-
-                results = model.fit(disp=False)   
-
-                results_bic.loc['AR{}'.format(p_val), 'MA{}'.format(q_val)] = eval('results.' + scoring)
-                if iteration % 10 == 0:
-                    print('    Iteration %d completed...' % iteration)
+                return np.nan
+            if seasonality:
+                # In order to get forecasts to be in the same value ranges of the
+                # orig_endogs, you must set the simple_differencing = False and
+                # the start_params to be the same as ARIMA.
+                # That is the only way to ensure that the output of this
+                # model is comparable to other ARIMA models
+
+                model = SARIMAX(
+                    ts_df,
+                    order=(ns_p, ns_d, ns_q),
+                    seasonal_order=(p_val, d_val, q_val, seasonal_period),
+                    enforce_stationarity=False,
+                    enforce_invertibility=False,
+                    trend='ct',
+                    start_params=[0, 0, 0, 1],
+                    simple_differencing=False
+                )
+            else:
+                model = SARIMAX(
+                    ts_df,
+                    order=(p_val, d_val, q_val),
+                    enforce_stationarity=False,
+                    enforce_invertibility=False,
+                    trend='ct',
+                    start_params=[0, 0, 0, 1],
+                    simple_differencing=False
+                )
+
+            start_params = None
+            if warm_start:
+                start_params = get_warm_start_params(params_cache, p_val, q_val, model.param_names)
+            # Only the information criterion is needed here, so the smoothed states are not kept
+            results = model.fit(start_params=start_params, disp=False, low_memory=True)
+            if start_params is not None and not results.mle_retvals.get('converged', True):
+                # A warm start that does not converge would make the metric of this order
+                # depend on the models fit before it, so fit it again from the default start
+                results = model.fit(disp=False, low_memory=True)
+            params_cache[(p_val, q_val)] = dict(zip(model.param_names, np.asarray(results.params)))
+            return getattr(results, scoring)
+
+        if stepwise:
+            if seasonality:
+                start_order = None
+            else:
+                start_order = _initial_order(np.diff(np.asarray(ts_df, dtype=float), n=d_val), p_max, q_max)
+            metrics = find_lowest_pq_stepwise(fit_order, p_max, q_max, start_order=start_order)
+            iteration += len(metrics)
+            print('    Stepwise search fit %d of %d models...' % (len(metrics), (p_max+1)*(q_max+1)))
+        else:
+            metrics = {}
+            for p_val, q_val in itertools.product(range(p_min,p_max+1), range(q_min, q_max+1)):
+                try:
+                    metrics[(p_val, q_val)] = fit_order(p_val, q_val)
+                    if iteration % 10 == 0:
+                        print('    Iteration %d completed...' % iteration)
+                        iteration += 1
+                    elif iteration >= 100:
+                        print('    Ending Iterations at %d' % iteration)
+                        break
+                except:
                     iteration += 1
-                elif iteration >= 100:
-                    print('    Ending Iterations at %d' % iteration)
-                    break
-            except:
-                iteration += 1
-                continue
+                    continue
+        for (p_val, q_val), metric_value in metrics.items():
+            results_bic.loc['AR{}'.format(p_val), 'MA{}'.format(q_val)] = metric_value
         results_bic = results_bic[results_bic.columns].astype(float)
 
         # # TODO: Print if needed
@@ -118,6 +277,9 @@ def find_best_pdq_or_PDQ(ts_df, scoring, p_max, d_max, q_max, non_seasonal_pdq,
             seasonality = True
         interim_p, interim_q, interim_bic = find_lowest_pq(results_bic)
         if verbose == 1:
+            import matplotlib.pyplot as plt  # type: ignore
+            import seaborn as sns  # type: ignore
+            _configure_plot_style()
             _, ax = plt.subplots(figsize=(20, 10))
             ax = sns.heatmap(results_bic, mask=results_bic.isnull(), ax=ax, annot=True, fmt='.0f')
             ax.set_title(scoring)
@@ -129,8 +291,8 @@ def find_best_pdq_or_PDQ(ts_df, scoring, p_max, d_max, q_max, non_seasonal_pdq,
         best_d = int(best_pdq.split(' ')[1])
         best_q = int(best_pdq.split(' ')[2])
     except:
-        best_p = copy.deepcopy(p_val)
-        best_q = copy.deepcopy(q_val)
+        best_p = copy.deepcopy(p_max)
+        best_q = copy.deepcopy(q_max)
         best_d = copy.deepcopy(d_val)
         best_bic = 0
 
@@ -7,6 +7,7 @@ import pandas as pd  # type: ignore
 from pandas.core.generic import NDFrame # type:ignore
 
 from tscv import GapWalkForward # type: ignore
+from joblib import Parallel, delayed  # type: ignore
 
 # imported ML models from scikit-learn
 from sklearn.model_selection import (ShuffleSplit, StratifiedShuffleSplit, # type: ignore
@@ -26,9 +27,14 @@ from ..utils import print_static_rmse, print_dynamic_rmse, convert_timeseries_da
 import pdb
 
 class BuildML(BuildBase):
-    def __init__(self, scoring: str = '', forecast_period: int = 2, verbose: int = 0):
+    def __init__(self, scoring: str = '', forecast_period: int = 2, verbose: int = 0, n_jobs: int = 1,
+                 successive_halving: bool = False, halving_eta: int = 3, halving_tol: float = 0.1):
         """
         Automatically build a ML Model
+        n_jobs: Number of threads used to cross validate the candidate models (-1 = all cores)
+        successive_halving: If True, all candidate models are first scored on the last 2 folds
+            only and just the best ceil(k/halving_eta) of them (and only those within halving_tol
+            of the best pilot score) get the full cross validation.
         """
         super().__init__(
             scoring=scoring,
@@ -37,6 +43,11 @@ class BuildML(BuildBase):
         )
 
         # Specific to ML model
+        self.n_jobs = n_jobs
+        self.successive_halving = successive_halving
+        self.halving_eta = halving_eta
+        self.halving_tol = halving_tol
+
         # These are needed so that during prediction later, the data can be transformed correctly
         self.lags: int = 0
 
@@ -133,31 +144,42 @@ class BuildML(BuildBase):
             print('Running multiple models...')
 
         model5 = SVR(C=0.1, kernel='rbf', degree=2)
-        results1 = cross_val_score(model5, X_train, y_train, cv=ts_cv, scoring=self.scoring)
-        estimators.append(('SVR', model5, abs(results1.mean()), abs(results1)  ))
 
         model6 = AdaBoostRegressor(
             base_estimator=DecisionTreeRegressor(
             min_samples_leaf=2, max_depth=1, random_state=seed),
             n_estimators=NUMS, random_state=seed
         )
-        results2 = cross_val_score(model6, X_train, y_train, cv=ts_cv, scoring=self.scoring)
-        estimators.append(('Extra Trees', model6, abs(results2.mean()), abs(results2)  ))
 
         model7 = LinearSVR(random_state=seed)
-        results3 = cross_val_score(model7, X_train, y_train, cv=ts_cv, scoring=self.scoring)
-        estimators.append(('LinearSVR', model7, abs(results3.mean()), abs(results3)  ))
 
         ## Create an ensemble model ####
         ensemble = BaggingRegressor(DecisionTreeRegressor(random_state=seed),
                                     n_estimators=NUMS, random_state=seed)
-        results4 = cross_val_score(ensemble, X_train, y_train, cv=ts_cv, scoring=self.scoring)
-        estimators.append(('Bagging', ensemble, abs(results4.mean()), abs(results4)  ))
+
+        candidates = [('SVR', model5), ('Extra Trees', model6), ('LinearSVR', model7), ('Bagging', ensemble)]
+
+        if self.successive_halving and len(candidates) > 1 and NFOLDS > 2:
+            ### Cheap pilot on the last 2 folds, then prune the inferior candidates
+            pilot_cv = GapWalkForward(n_splits=2, gap_size=0, test_size=self.forecast_period)
+            pilot_scores = [abs(results.mean()) for results in
+                            self._cross_validate(candidates, X_train, y_train, pilot_cv)]
+            n_keep = int(np.ceil(len(candidates)/self.halving_eta))
+            best_pilot = min(pilot_scores)
+            keep = [i for i in np.argsort(pilot_scores, kind='stable')[:n_keep]
+                    if pilot_scores[i] <= best_pilot*(1+self.halving_tol)]
+            if self.verbose >= 1:
+                print('    Pruned after pilot folds: %s' % [name for i, (name, _) in enumerate(candidates)
+                                                             if i not in keep])
+            candidates = [candidates[i] for i in sorted(keep)]
+
+        cv_results = self._cross_validate(candidates, X_train, y_train, ts_cv)
+        for (name, model), results in zip(candidates, cv_results):
+            estimators.append((name, model, abs(results.mean()), abs(results)  ))
 
         if self.verbose == 1:
-            print('    Instance Based = %0.4f \n    Boosting = %0.4f\n    Linear Model = %0.4f \n    Bagging = %0.4f' %(
-            abs(results1.mean())/y_train.std(), abs(results2.mean())/y_train.std(),
-            abs(results3.mean())/y_train.std(), abs(results4.mean())/y_train.std()))
+            for name, _, score, _ in estimators:
+                print('    %s = %0.4f' % (name, score/y_train.std()))
 
         besttype = sorted(estimators, key=lambda x: x[2], reverse=False)[0][0]
         # print(f"Best Model: {besttype}")
@@ -195,6 +217,18 @@ class BuildML(BuildBase):
         # return self.model, forecast['mean'], rmse, norm_rmse
         return self.model, forecast_df_folds, rmse_folds, norm_rmse_folds
 
+    def _cross_validate(self, candidates, X_train, y_train, ts_cv):
+        """
+        Returns the cross validation scores of each (name, model) candidate.
+        The candidates are independent, so they are cross validated concurrently.
+        Threads are used since sklearn releases the GIL in the heavy parts and this
+        usually already runs inside a worker process of auto_timeseries.
+        """
+        return Parallel(n_jobs=self.n_jobs, prefer='threads')(
+            delayed(cross_val_score)(model, X_train, y_train, cv=ts_cv, scoring=self.scoring)
+            for _, model in candidates
+        )
+
     def order_df(self, ts_df: pd.DataFrame) -> pd.DataFrame:
         """
         Given a dataframe (original), this will order the columns with
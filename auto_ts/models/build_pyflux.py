@@ -1,3 +1,4 @@
+import importlib.util
 import numpy as np # type: ignore
 import pandas as pd  # type: ignore
 import itertools
@@ -5,6 +6,9 @@ import operator
 # helper functions
 from ..utils import print_static_rmse, print_dynamic_rmse
 
+# PyFlux is unmaintained and usually not installed, so check for it only once at import
+_HAS_PYFLUX = importlib.util.find_spec('pyflux') is not None
+
 
 #########################################################
 def build_pyflux_model(df, target, ar=3, ma=3,integ=1, forecast_period=2,
@@ -15,12 +19,11 @@ def build_pyflux_model(df, target, ar=3, ma=3,integ=1, forecast_period=2,
     PyFlux is a fiendishly complicated program with very poor documentation.
     I had to dig deep into the API to figure these things out especially the
     """
-    try:
-        # imported pyflux pkg
-        import pyflux as pf  # type: ignore
-    except:
+    if not _HAS_PYFLUX:
         print('Pyflux is not installed - hence not running PyFlux model')
         return 'error','error','error','error'
+    # imported pyflux pkg
+    import pyflux as pf  # type: ignore
     ts_df = df[:]
     ##############################################################################
     ts_train = ts_df[:-forecast_period]
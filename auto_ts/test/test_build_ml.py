@@ -0,0 +1,67 @@
+"""
+Unit Tests for BuildML
+
+Only checks which candidates get cross validated, not the values of the forecasts
+"""
+
+import sys
+import os
+import unittest
+import pandas as pd # type: ignore
+
+sys.path.append(os.environ['DEV_AUTOTS'])
+from auto_ts.models.build_ml import BuildML
+
+class TestSuccessiveHalving(unittest.TestCase):
+
+    def setUp(self):
+        datapath = 'example_datasets/'
+        filename1 = 'Sales_and_Marketing.csv'
+        dft = pd.read_csv(datapath + filename1, index_col = None)
+        dft['Time Period'] = pd.to_datetime(dft['Time Period'])
+
+        self.train = dft.set_index('Time Period')
+        self.target = 'Sales'
+        self.cv = 4
+
+    def fit(self, successive_halving):
+        """
+        Fits BuildML and returns the (candidate names, number of folds) of every _cross_validate call
+        """
+        calls = []
+        model_build = BuildML(forecast_period=5, successive_halving=successive_halving)
+        cross_validate = model_build._cross_validate
+
+        def record(candidates, X_train, y_train, ts_cv):
+            calls.append(([name for name, _ in candidates], ts_cv.n_splits))
+            return cross_validate(candidates, X_train, y_train, ts_cv)
+
+        model_build._cross_validate = record
+        model_build.fit(ts_df=self.train, target_col=self.target, cv=self.cv)
+        return calls
+
+    def test_disabled(self):
+        """
+        Without successive halving every candidate is cross validated on all folds
+        """
+        calls = self.fit(successive_halving=False)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0][1], self.cv)
+        self.assertEqual(len(calls[0][0]), 4)
+
+    def test_pruned_candidates_not_fully_cross_validated(self):
+        """
+        All candidates get the 2 pilot folds, only the surviving ones get all folds
+        """
+        calls = self.fit(successive_halving=True)
+        self.assertEqual(len(calls), 2)
+        (pilot, pilot_folds), (full, full_folds) = calls
+        self.assertEqual(pilot_folds, 2)
+        self.assertEqual(len(pilot), 4)
+        self.assertEqual(full_folds, self.cv)
+        self.assertGreaterEqual(len(full), 1)
+        self.assertLessEqual(len(full), 2)  # ceil(4/halving_eta) with the default halving_eta = 3
+        self.assertTrue(set(full) < set(pilot))
+
+if __name__ == '__main__':
+    unittest.main()
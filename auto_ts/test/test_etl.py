@@ -0,0 +1,57 @@
+"""
+Unit Tests for validating an in memory dataframe (_validate_dataframe)
+"""
+
+import sys
+import os
+import io
+import contextlib
+import unittest
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+
+from pandas.testing import assert_frame_equal # type: ignore
+
+sys.path.append(os.environ['DEV_AUTOTS'])
+from auto_ts.utils.etl import _validate_dataframe
+
+class TestValidateDataframe(unittest.TestCase):
+
+    def setUp(self):
+        self.dft = pd.DataFrame({
+            'Marketing Expense': [1.0, 2.0, 3.0, 4.0],
+            'Time Period': ['2011-01-01', '2011-02-01', '2011-03-01', '2011-04-01'],
+            'Sales': [10.0, 20.0, 30.0, 40.0],
+        })
+
+    def test_index_and_column_order(self):
+        """
+        The ts_column becomes the index and the target the first column, the input is not changed
+        """
+        original = self.dft.copy()
+        ts_df = _validate_dataframe(self.dft, 'Time Period', 'Sales')
+        self.assertListEqual(list(ts_df), ['Sales', 'Marketing Expense'])
+        self.assertIsInstance(ts_df.index, pd.DatetimeIndex)
+        self.assertEqual(ts_df.index.name, 'Time Period')
+        assert_frame_equal(self.dft, original)
+
+    def test_missing_timestamps(self):
+        """
+        None / NaN timestamps are kept as NaT instead of rejecting the frame
+        """
+        self.dft.loc[1, 'Time Period'] = None
+        self.dft.loc[2, 'Time Period'] = np.nan
+        ts_df = _validate_dataframe(self.dft, 'Time Period', 'Sales')
+        self.assertEqual(ts_df.shape, (4, 2))
+        self.assertEqual(ts_df.index.isnull().sum(), 2)
+
+    def test_unparseable_timestamps(self):
+        """
+        A value that is not a date time is an error: '' is returned
+        """
+        self.dft.loc[1, 'Time Period'] = 'not a date'
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(_validate_dataframe(self.dft, 'Time Period', 'Sales'), '')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,274 @@
+"""
+Unit Tests for auto_timeseries.fit that do not need FB Prophet:
+the statistical and ML model families on the Sales and Marketing data
+"""
+
+import sys
+import os
+import io
+import subprocess
+import contextlib
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+
+from pandas.testing import assert_frame_equal # type: ignore
+
+sys.path.append(os.environ['DEV_AUTOTS'])
+from auto_ts import auto_timeseries as ATS, ModelEntry, _infer_time_interval
+from auto_ts.models import BuildAutoSarimax, BuildVAR, BuildML
+
+class TestFit(unittest.TestCase):
+
+    def setUp(self):
+        datapath = 'example_datasets/'
+        filename1 = 'Sales_and_Marketing.csv'
+        dft = pd.read_csv(datapath + filename1, index_col = None)
+
+        self.ts_column = 'Time Period'
+        self.target = 'Sales'
+        self.train_multivar = dft[:40]
+
+    def fit(self, train, **kwargs):
+        """
+        Fits the statistical and ML models and returns the model with the number of times each
+        model build was fit (in this process, so n_jobs=1)
+        """
+        builds = [BuildAutoSarimax, BuildVAR, BuildML]
+        with contextlib.ExitStack() as stack:
+            fits = [stack.enter_context(mock.patch.object(build, 'fit', autospec=True, side_effect=build.fit))
+                    for build in builds]
+            stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+            model = ATS(forecast_period=4, model_type=['stats', 'ML'], n_jobs=1, **kwargs)
+            model.fit(train, ts_column=self.ts_column, target=self.target, cv=3)
+        return model, {build.__name__: fit.call_count for build, fit in zip(builds, fits)}
+
+
+class TestCache(TestFit):
+
+    def test_second_fit_builds_nothing(self):
+        """
+        With cache_dir, fitting the same data again loads every model family from the cache
+        """
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first, built = self.fit(self.train_multivar, cache_dir=cache_dir)
+            self.assertEqual(built, {'BuildAutoSarimax': 1, 'BuildVAR': 1, 'BuildML': 1})
+            second, built = self.fit(self.train_multivar, cache_dir=cache_dir)
+            self.assertEqual(built, {'BuildAutoSarimax': 0, 'BuildVAR': 0, 'BuildML': 0})
+            self.assertListEqual(list(second.get_leaderboard()['name']),
+                                 list(first.get_leaderboard()['name']))
+
+    def test_changed_data_is_built_again(self):
+        """
+        Other values of the target are a different cache entry
+        """
+        changed = self.train_multivar.copy()
+        changed[self.target] = changed[self.target] * 2
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.fit(self.train_multivar, cache_dir=cache_dir)
+            _, built = self.fit(changed, cache_dir=cache_dir)
+            self.assertEqual(built, {'BuildAutoSarimax': 1, 'BuildVAR': 1, 'BuildML': 1})
+
+class TestOutput(TestFit):
+
+    def fit_verbose(self, verbose):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            ATS(forecast_period=4, model_type=['stats', 'ML'], n_jobs=1, verbose=verbose).fit(
+                self.train_multivar, ts_column=self.ts_column, target=self.target, cv=3)
+        return stdout.getvalue()
+
+    def test_quiet(self):
+        """
+        Nothing is printed at verbose=0, including what the model builds print
+        """
+        self.assertEqual(self.fit_verbose(0), '')
+
+    def test_builder_prints_are_logged(self):
+        """
+        With verbose=1 what the model builds print is logged at INFO on the auto_ts logger
+        """
+        with self.assertLogs('auto_ts', 'INFO') as logs:
+            stdout = self.fit_verbose(1)
+        self.assertEqual(stdout, '')
+        # Printed by BuildVAR.find_best_parameters
+        self.assertTrue(any('Best variable selected for VAR' in line for line in logs.output))
+
+
+class TestModelEntries(TestFit):
+
+    def test_entries(self):
+        """
+        After fitting the statistical and ML families every ml_dict value is a ModelEntry that
+        still reads like the old nested dictionaries, and the leaderboard and best model use it
+        """
+        model, _ = self.fit(self.train_multivar)
+        ml_dict = model.get_ml_dict()
+        self.assertListEqual(list(ml_dict), ['auto_SARIMAX', 'VAR', 'ML'])
+        for name, entry in ml_dict.items():
+            self.assertIsInstance(entry, ModelEntry)
+            self.assertIs(entry[model.score_type], entry.score)
+            self.assertIs(entry.get('model'), entry.model)
+            self.assertIs(entry['forecast'], entry.forecast)
+            self.assertIs(entry.get('model_build'), entry.model_build)
+            self.assertIsNone(entry.get('missing'))
+            self.assertIs(model.get_model(name), entry.model)
+            self.assertIs(model.get_model_build(name), entry.model_build)
+            self.assertTrue(np.all(np.isfinite(entry.score)), name)
+
+        leaderboard = model.get_leaderboard()
+        means = {name: np.mean(entry.score) for name, entry in ml_dict.items()}
+        self.assertListEqual(list(leaderboard['name']), sorted(means, key=means.get))
+        np.testing.assert_allclose(leaderboard[model.score_type], [means[name] for name in leaderboard['name']])
+
+        best = min(means, key=means.get)
+        self.assertEqual(model.get_best_model_name(), best)
+        self.assertIs(model.get_best_model(), ml_dict[best].model)
+        self.assertIs(model.get_best_model_build(), ml_dict[best].model_build)
+
+        cv_scores = model.get_cv_scores()
+        self.assertEqual(len(cv_scores), sum(np.size(entry.score) for entry in ml_dict.values()))
+
+
+class TestBestModel(unittest.TestCase):
+    """
+    Best model and leaderboard from the results of the model builders (without fitting them)
+    """
+    def add_results(self, scores, **kwargs):
+        model = ATS(**kwargs)
+        model._add_results([(name, 'model ' + name, None, score, 'build ' + name)
+                            for name, score in scores.items()])
+        return model
+
+    def sorted_leaderboard(self, model, ascending=True):
+        """
+        The leaderboard as it was built before: mean CV scores in ml_dict order, then sort_values
+        """
+        leaderboard = pd.DataFrame({'name': list(model.ml_dict),
+                                    model.score_type: [np.mean(entry.score) for entry in model.ml_dict.values()]})
+        return leaderboard.sort_values(model.score_type, ascending=ascending)
+
+    def check(self, scores, best, order, **kwargs):
+        model = self.add_results(scores, **kwargs)
+        self.assertEqual(model.get_best_model_name(), best)
+        self.assertEqual(model.get_best_model(), 'model ' + best)
+        self.assertListEqual(list(model.get_leaderboard()['name']), order)
+        for ascending in [True, False]:
+            assert_frame_equal(model.get_leaderboard(ascending=ascending),
+                               self.sorted_leaderboard(model, ascending=ascending), check_index_type=False)
+        return model
+
+    def test_cv_scores(self):
+        """
+        The mean of the CV scores is compared, the index is the position in ml_dict
+        """
+        model = self.check({'auto_SARIMAX': [3.0, 5.0], 'VAR': [1.0, 2.0], 'ML': [2.0, 2.0]},
+                           'VAR', ['VAR', 'ML', 'auto_SARIMAX'])
+        self.assertListEqual(list(model.get_leaderboard().index), [1, 2, 0])
+        self.assertListEqual(list(model.get_leaderboard(ascending=False).index), [0, 2, 1])
+        self.assertListEqual(list(model.get_leaderboard()['rmse']), [1.5, 2.0, 4.0])
+
+    def test_ties(self):
+        """
+        Of models with the same score the first one is the best, and comes first in the leaderboard
+        """
+        self.check({'auto_SARIMAX': [1.0, 3.0], 'VAR': 2.0, 'ML': [2.0]}, 'auto_SARIMAX',
+                   ['auto_SARIMAX', 'VAR', 'ML'])
+
+    def test_nan_scores(self):
+        """
+        A NaN score is never the best and is last in the leaderboard, also when descending
+        """
+        model = self.check({'auto_SARIMAX': np.nan, 'VAR': 5.0, 'ML': [1.0, np.nan]}, 'VAR',
+                           ['VAR', 'auto_SARIMAX', 'ML'])
+        self.assertListEqual(list(model.get_leaderboard(ascending=False)['name']), ['VAR', 'auto_SARIMAX', 'ML'])
+        self.check({'auto_SARIMAX': np.nan, 'VAR': np.inf}, 'VAR', ['VAR', 'auto_SARIMAX'])
+
+    def test_skipped_families(self):
+        """
+        Skipped (or failed) model families have an infinite score: listed last, never the best
+        unless no model could be built, then it is the first of them
+        """
+        self.check({'auto_SARIMAX': [10.0, 12.0], 'VAR': np.inf, 'ML': np.inf}, 'auto_SARIMAX',
+                   ['auto_SARIMAX', 'VAR', 'ML'])
+        self.check({'VAR': np.inf, 'ML': np.inf}, 'VAR', ['VAR', 'ML'])
+
+    def test_score_type(self):
+        """
+        The score column of the leaderboard is named after the score_type
+        """
+        model = self.check({'VAR': 0.5, 'ML': 0.25}, 'ML', ['ML', 'VAR'], score_type='normalized_rmse')
+        self.assertListEqual(list(model.get_leaderboard()), ['name', 'normalized_rmse'])
+
+
+class TestTimeInterval(unittest.TestCase):
+
+    def test_regular_spacings(self):
+        """
+        Each supported spacing maps to its time interval
+        """
+        cases = [(pd.Timedelta(seconds=1), 'minutes'), (pd.Timedelta(minutes=15), 'minutes'),
+                 (pd.Timedelta(hours=1), 'hours'), (pd.Timedelta(hours=6), 'hours'),
+                 (pd.Timedelta(days=1), 'days'), (pd.Timedelta(weeks=1), 'weeks'),
+                 (pd.offsets.MonthBegin(), 'months'), (pd.offsets.MonthEnd(), 'months'),
+                 (pd.offsets.QuarterBegin(startingMonth=1), 'qtr'), (pd.offsets.MonthBegin(6), 'semi'),
+                 (pd.offsets.YearBegin(), 'years')]
+        for freq, expected in cases:
+            index = pd.date_range('2020-01-01', periods=30, freq=freq)
+            self.assertEqual(_infer_time_interval(index), expected, freq)
+
+    def test_gapped_monthly(self):
+        """
+        A few missing months and a missing timestamp do not change the median spacing
+        """
+        index = pd.date_range('2015-01-01', periods=48, freq=pd.offsets.MonthBegin()).delete([5, 6, 20, 33])
+        self.assertEqual(_infer_time_interval(index), 'months')
+        self.assertEqual(_infer_time_interval(index.insert(10, pd.NaT)), 'months')
+
+    def test_descending(self):
+        """
+        A descending index has the same interval as the ascending one
+        """
+        for freq, expected in [(pd.Timedelta(hours=1), 'hours'), (pd.offsets.MonthBegin(), 'months')]:
+            index = pd.date_range('2020-01-01', periods=30, freq=freq)[::-1]
+            self.assertEqual(_infer_time_interval(index), expected)
+
+    def test_unsupported_spacing(self):
+        """
+        Spacings that match no interval raise a ValueError that asks for the time_interval
+        """
+        for freq in [pd.Timedelta(hours=36), pd.Timedelta(days=3), pd.Timedelta(days=14)]:
+            index = pd.date_range('2020-01-01', periods=30, freq=freq)
+            with self.assertRaisesRegex(ValueError, 'time_interval'):
+                _infer_time_interval(index)
+        for index in [pd.DatetimeIndex(['2020-01-01'] * 5), pd.DatetimeIndex(['2020-01-01'])]:
+            with self.assertRaisesRegex(ValueError, 'time_interval'):
+                _infer_time_interval(index)
+
+    def test_fit_raises(self):
+        """
+        fit raises the error instead of returning None
+        """
+        dft = pd.DataFrame({'Time Period': pd.date_range('2020-01-01', periods=40, freq=pd.Timedelta(hours=36)),
+                            'Sales': np.arange(40.)})
+        with self.assertRaisesRegex(ValueError, 'median spacing of the timestamps is 1 days 12:00:00'):
+            ATS(model_type='ML').fit(dft, ts_column='Time Period', target='Sales')
+
+
+class TestImport(unittest.TestCase):
+
+    def test_no_plotting_modules(self):
+        """
+        Importing auto_ts does not load matplotlib (checked in a new interpreter)
+        """
+        code = ("import sys; sys.path.append(%r); import auto_ts; "
+                "print([name for name in ('matplotlib.pyplot', 'seaborn') if name in sys.modules])"
+                % os.environ['DEV_AUTOTS'])
+        output = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE,
+                                universal_newlines=True, check=True).stdout
+        self.assertEqual(output.strip().splitlines()[-1], '[]')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Unit Tests for the RMSE helper (_rmse)
+"""
+
+import sys
+import os
+import unittest
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+
+sys.path.append(os.environ['DEV_AUTOTS'])
+from auto_ts.utils.metrics import _rmse
+
+class TestRMSE(unittest.TestCase):
+
+    def test_same_as_numpy(self):
+        """
+        Same result as the numpy expression, with the missing values of a Series skipped
+        """
+        y_true = np.array([1.0, 2.0, 4.0, 8.0])
+        y_pred = np.array([1.5, 2.0, 3.0, 9.0])
+        self.assertAlmostEqual(_rmse(y_true, y_pred), np.sqrt(np.mean((y_true - y_pred)**2)))
+        y_pred[1] = np.nan
+        expected = np.sqrt(np.mean((pd.Series(y_true) - y_pred)**2))
+        self.assertAlmostEqual(_rmse(pd.Series(y_true), y_pred), expected)
+
+    def test_2d_inputs(self):
+        """
+        A column vector is compared element by element with a flat array of the same length,
+        instead of being broadcast to an n x n difference as np.sqrt(np.mean((y_true - y_pred)**2)) did
+        """
+        y_true = np.array([1.0, 2.0, 4.0, 8.0])
+        y_pred = np.array([1.5, 2.0, 3.0, 9.0])
+        expected = np.sqrt(np.mean((y_true - y_pred)**2))
+        self.assertAlmostEqual(_rmse(y_true.reshape(-1, 1), y_pred), expected)
+        self.assertAlmostEqual(_rmse(y_true, y_pred.reshape(-1, 1)), expected)
+        self.assertAlmostEqual(_rmse(y_true.reshape(-1, 1), y_pred.reshape(-1, 1)), expected)
+        self.assertAlmostEqual(_rmse(pd.Series(y_true), y_pred.reshape(-1, 1)), expected)
+
+    def test_misaligned_series(self):
+        """
+        Two Series with different indexes are still aligned on the index:
+        only the common index values are compared
+        """
+        y_true = pd.Series([1.0, 2.0, 4.0, 8.0], index=[0, 1, 2, 3])
+        y_pred = pd.Series([1.5, 2.0, 3.0, 9.0], index=[2, 3, 4, 5])
+        self.assertAlmostEqual(_rmse(y_true, y_pred), np.sqrt(np.mean((np.array([4.0, 8.0]) - [1.5, 2.0])**2)))
+        # Same values in another order of the index
+        self.assertAlmostEqual(_rmse(y_true, y_true.iloc[::-1]), 0.0)
+
+    def test_dataframe(self):
+        """
+        DataFrames keep the pandas semantics (column-wise alignment)
+        """
+        y_true = pd.DataFrame({'a': [1.0, 2.0, 4.0]})
+        y_pred = pd.DataFrame({'a': [1.0, 3.0, 4.0]})
+        self.assertAlmostEqual(float(np.asarray(_rmse(y_true, y_pred)).ravel()[0]), np.sqrt(1/3))
+
+    def test_different_lengths(self):
+        """
+        Arrays of different lengths raise instead of being read out of bounds
+        """
+        with self.assertRaises(ValueError):
+            _rmse(np.arange(5.), np.arange(4.))
+        with self.assertRaises(ValueError):
+            _rmse(pd.Series(np.arange(3.)), np.arange(6.).reshape(3, 2))
+
+if __name__ == '__main__':
+    unittest.main()
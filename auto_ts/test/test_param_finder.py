@@ -0,0 +1,129 @@
+"""
+Unit Tests for the stepwise (p, q) order search (find_lowest_pq_stepwise)
+
+Uses a fake fit_order with a known minimum instead of fitting real models
+"""
+
+import sys
+import os
+import unittest
+import io
+import contextlib
+import warnings
+import itertools
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+from statsmodels.tsa.statespace.sarimax import SARIMAX  # type: ignore
+
+sys.path.append(os.environ['DEV_AUTOTS'])
+from auto_ts.models.ar_based.param_finder import find_lowest_pq_stepwise, _initial_order, find_best_pdq_or_PDQ
+
+class TestStepwiseSearch(unittest.TestCase):
+
+    def search(self, best_p, best_q, p_max=5, q_max=5, start_order=None):
+        calls = []
+
+        def fit_order(p_val, q_val):
+            calls.append((p_val, q_val))
+            return (p_val - best_p)**2 + (q_val - best_q)**2
+
+        fitted = find_lowest_pq_stepwise(fit_order, p_max, q_max, start_order=start_order)
+        return fitted, calls
+
+    def test_reaches_minimum(self):
+        """
+        The search must end at the known minimum, including along the (p-1, q+1) diagonal
+        """
+        for best_p, best_q in [(0, 0), (3, 1), (1, 4), (5, 5), (4, 0)]:
+            fitted, _ = self.search(best_p, best_q)
+            self.assertEqual(min(fitted, key=fitted.get), (best_p, best_q))
+
+    def test_anti_diagonal_neighbour(self):
+        """
+        (2, 2) is the best seed and (1, 3) is its only better neighbour, via (p-1, q+1)
+        """
+        def fit_order(p_val, q_val):
+            return {(1, 3): 0.0, (2, 2): 5.0}.get((p_val, q_val), 100.0)
+
+        fitted = find_lowest_pq_stepwise(fit_order, 5, 5)
+        self.assertIn((1, 3), fitted)
+        self.assertEqual(min(fitted, key=fitted.get), (1, 3))
+
+    def test_never_fits_twice(self):
+        """
+        Every order is fit at most once and stays within (p_max, q_max)
+        """
+        _, calls = self.search(3, 2, p_max=4, q_max=3, start_order=(2, 2))
+        self.assertEqual(len(calls), len(set(calls)))
+        self.assertTrue(all(0 <= p <= 4 and 0 <= q <= 3 for p, q in calls))
+        self.assertLess(len(calls), 5 * 4)
+
+    def test_failed_fits(self):
+        """
+        Orders that can not be fit are recorded as NaN and skipped
+        """
+        def fit_order(p_val, q_val):
+            if p_val > 1:
+                raise ValueError('not stationary')
+            return float(p_val + q_val)
+
+        fitted = find_lowest_pq_stepwise(fit_order, 3, 3)
+        self.assertTrue(np.isnan(fitted[(2, 2)]))
+        self.assertEqual(min((k for k in fitted if np.isfinite(fitted[k])), key=fitted.get), (0, 0))
+
+class TestInitialOrder(unittest.TestCase):
+
+    def test_constant_series(self):
+        """
+        A constant series (e.g. a linear trend differenced once) has no ACF: no seed instead of an error
+        """
+        self.assertIsNone(_initial_order(np.ones(50), 3, 3))
+        self.assertIsNone(_initial_order(np.diff(np.arange(50.)), 3, 3))
+
+    def test_ar1(self):
+        """
+        A strongly autocorrelated AR(1) series gives a seed with p >= 1
+        """
+        np.random.seed(0)
+        y = np.zeros(300)
+        for t in range(1, 300):
+            y[t] = 0.8 * y[t - 1] + np.random.randn()
+        p_val, q_val = _initial_order(y, 3, 3)
+        self.assertGreaterEqual(p_val, 1)
+        self.assertLessEqual(q_val, 3)
+
+class TestOrderSearch(unittest.TestCase):
+
+    def setUp(self):
+        datapath = 'example_datasets/'
+        filename1 = 'Sales_and_Marketing.csv'
+        self.dft = pd.read_csv(datapath + filename1, index_col = None)
+
+    def cold_grid(self, y, p_max, d_val, q_max):
+        """
+        (p, q) with the lowest AIC when every order is fit on its own from the default start
+        """
+        aics = {}
+        for p_val, q_val in itertools.product(range(p_max+1), range(q_max+1)):
+            if (p_val, d_val, q_val) == (0, 0, 0):
+                continue
+            model = SARIMAX(y, order=(p_val, d_val, q_val), enforce_stationarity=False,
+                            enforce_invertibility=False, trend='ct', simple_differencing=False)
+            aics[(p_val, q_val)] = model.fit(disp=False).aic
+        return min(aics, key=aics.get)
+
+    def test_same_order_as_cold_grid(self):
+        """
+        The exhaustive search selects the same order as independent (unconcentrated, cold) fits
+        """
+        for col, d_val in itertools.product(['Sales', 'Marketing Expense'], [0, 1]):
+            y = self.dft[col].astype(float)
+            with warnings.catch_warnings(), contextlib.redirect_stdout(io.StringIO()):
+                warnings.simplefilter('ignore')
+                best_p, best_d, best_q, _, _ = find_best_pdq_or_PDQ(
+                    y, 'aic', 2, 1, 2, None, 12, stepwise=False, d=d_val)
+                expected = self.cold_grid(y, 2, d_val, 2)
+            self.assertEqual((best_p, best_d, best_q), (expected[0], d_val, expected[1]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,7 +21,7 @@ from pandas.testing import assert_frame_equal # type: ignore
 from statsmodels.tsa.statespace.sarimax import SARIMAXResultsWrapper  # type: ignore
 
 sys.path.append(os.environ['DEV_AUTOTS'])
-from auto_ts import auto_timeseries as ATS
+from auto_ts import auto_timeseries as ATS, _shift_predictors
 
 class TestVAR(unittest.TestCase):
 
@@ -330,4 +330,47 @@ class TestVAR(unittest.TestCase):
 
         self.assertEqual(
             round(ml_dict.get('VAR').get('rmse'), 8), self.rmse_gold_var_univar,
-            "(Univar Test) VAR RMSE does not match up with expected values.")
\ No newline at end of file
+            "(Univar Test) VAR RMSE does not match up with expected values.")
+
+
+class TestShiftPredictors(unittest.TestCase):
+
+    def setUp(self):
+        datapath = 'example_datasets/'
+        filename1 = 'Sales_and_Marketing.csv'
+        dft = pd.read_csv(datapath + filename1, index_col = None)
+        dft.index = pd.to_datetime(dft.pop('Time Period'))
+        self.target = 'Sales'
+        self.preds = ['Marketing Expense']
+        self.ts_df = dft[[self.target] + self.preds]
+
+    def baseline(self, ts_df):
+        """
+        How the VAR builder used to build the frame
+        """
+        ts_df_shifted = ts_df.copy(deep=True)
+        ts_df_shifted[self.preds] = ts_df_shifted[self.preds].shift(1)
+        ts_df_shifted.dropna(axis=0, inplace=True)
+        return ts_df_shifted[[self.target] + self.preds]
+
+    def test_same_as_shift_and_dropna(self):
+        """
+        Same frame as shift(1) + dropna, including missing values in the middle of the series
+        """
+        ts_df = self.ts_df.astype(float)
+        ts_df.iloc[[10, 11], 1] = np.nan  # predictor
+        ts_df.iloc[20, 0] = np.nan  # target
+        original = ts_df.copy()
+        shifted = _shift_predictors(ts_df, self.target, self.preds)
+        assert_frame_equal(shifted, self.baseline(ts_df))
+        self.assertEqual(shifted.shape[0], ts_df.shape[0] - 1 - 3)
+        assert_frame_equal(ts_df, original)
+
+    def test_no_missing_values(self):
+        """
+        Without missing values only the first row is dropped. Integer predictors stay
+        integers here (shift made them floats), the values are the same
+        """
+        shifted = _shift_predictors(self.ts_df, self.target, self.preds)
+        assert_frame_equal(shifted, self.baseline(self.ts_df), check_dtype=False)
+        self.assertEqual(shifted.shape[0], self.ts_df.shape[0] - 1)
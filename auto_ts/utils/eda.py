@@ -1,16 +1,11 @@
 import numpy as np # type: ignore
 import pandas as pd # type: ignore
-import matplotlib.dates as mdates # type: ignore
 from itertools import cycle
-import matplotlib.pyplot as plt # type: ignore
-import seaborn as sns # type: ignore
-# This gives an error when running from a python script. 
-# Maybe, this should be set in the jupyter notebook directly.
-# get_ipython().magic('matplotlib inline')
-sns.set(style="white", color_codes=True)
 # TSA from Statsmodels
 import statsmodels.tsa.api as smt # type: ignore
 
+from .plotting import _configure_plot_style
+
 
 def time_series_plot(y, lags=31, title='Original Time Series', chart_type='line',
                      chart_time='years'):
@@ -21,6 +16,9 @@ def time_series_plot(y, lags=31, title='Original Time Series', chart_type='line'
     to be Pandas datetime. It assumes that you want to see default lags of 31.
     But you can modify it to suit.
     """
+    import matplotlib.pyplot as plt  # type: ignore
+    import matplotlib.dates as mdates  # type: ignore
+    _configure_plot_style()
     colors = cycle('byrcmgkbyrcmgkbyrcmgkbyrcmgkbyr')
     fig = plt.figure(figsize=(20, 20))
     grid = plt.GridSpec(3, 2, wspace=0.5, hspace=0.5)
@@ -106,6 +104,8 @@ def top_correlation_to_name(stocks, column_name, searchstring, top=5):
     coefficient to select rows.
     ####################################################################################
     """
+    import matplotlib.pyplot as plt  # type: ignore
+    _configure_plot_style()
     #### First increment top by 1 since you are asking for top X names in addition to the one you have, top += 1
     incl = [x for x in list(stocks) if x not in column_name]
     ### First drop all NA rows since they will mess up your correlations, stocks.dropna(inplace=True)
@@ -186,6 +186,8 @@ def test_stationarity(timeseries, maxlag=2, regression='c', autolag=None,
         print('autolag: {}'.format(autolag))
     alpha = 0.05
     if plot:
+        import matplotlib.pyplot as plt  # type: ignore
+        _configure_plot_style()
         if window is None:
             window = 4
         # Determing rolling statistics
@@ -9,33 +9,50 @@ def load_ts_data(filename, ts_column, sep, target):
     """
     This function loads a given filename into a pandas dataframe and sets the
     ts_column as a Time Series index. Note that filename should contain the full
-    path to the file.
+    path to the file. filename can also be a dataframe, in which case it is only validated.
     """
     if isinstance(filename, str):
-        codes_list = ['utf-8', 'iso-8859-1', 'cp1252', 'latin1']
-        print('First loading %s and then setting %s as date time index...' % (filename, ts_column))
-        for codex in codes_list:
-            try:
-                df = pd.read_csv(filename, index_col=None, sep=sep, encoding=codex)
-                df.index = pd.to_datetime(df.pop(ts_column))
-                break
-            except:
-                print('    Encoder %s or Date time type not working for reading this file...' % codex)
-                continue
-    else:
-        ### If filename is not a string, it must be a dataframe and can be loaded
-        dft = copy.deepcopy(filename)
+        return _load_from_path(filename, ts_column, sep, target)
+    ### If filename is not a string, it must be a dataframe and can be loaded
+    return _validate_dataframe(filename, ts_column, target)
+
+
+def _load_from_path(filename, ts_column, sep, target):
+    """
+    Reads a csv file (trying a few encodings) and sets the ts_column as a Time Series index.
+    """
+    codes_list = ['utf-8', 'iso-8859-1', 'cp1252', 'latin1']
+    print('First loading %s and then setting %s as date time index...' % (filename, ts_column))
+    for codex in codes_list:
         try:
-            dft.index = pd.to_datetime(dft.pop(ts_column))
-            preds = [x for x in list(dft) if x not in [target]]
-            df = dft[[target]+preds]
-        except Exception as e:
-            print(e)
-            print('Error: Could not convert Time Series column to an index. Please check your input and try again')
-            return ''
+            df = pd.read_csv(filename, index_col=None, sep=sep, encoding=codex)
+            df.index = pd.to_datetime(df.pop(ts_column))
+            break
+        except:
+            print('    Encoder %s or Date time type not working for reading this file...' % codex)
+            continue
     return df
 
 
+def _validate_dataframe(df, ts_column, target):
+    """
+    Sets the ts_column of an in memory dataframe as a Time Series index with the target
+    as the first column. The input dataframe is not modified.
+    Returns '' if the ts_column can not be converted to date times. Missing values
+    (None, NaN, NaT) are kept as NaT, as load_ts_data has always done.
+    """
+    try:
+        ts_index = pd.to_datetime(df[ts_column], cache=True)
+        preds = [x for x in list(df) if x not in [target, ts_column]]
+        dft = df[[target]+preds]
+        dft.index = pd.DatetimeIndex(ts_index, name=ts_column)
+    except Exception as e:
+        print(e)
+        print('Error: Could not convert Time Series column to an index. Please check your input and try again')
+        return ''
+    return dft
+
+
 def time_series_split(ts_df):
     """
     This utility splits any dataframe sent as a time series split using the sklearn function.
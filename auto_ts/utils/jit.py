@@ -0,0 +1,22 @@
+"""Optional numba support
+
+numba is not a required dependency. If it is not installed, njit returns the function
+unchanged and prange is the builtin range, so that the decorated functions still run
+(slowly) as plain python. Use HAS_NUMBA to decide whether a jitted code path is worth it.
+"""
+
+try:
+    from numba import njit, prange  # type: ignore
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range  # type: ignore
+
+    def njit(*args, **kwargs):  # type: ignore
+        """No-op replacement for numba.njit (supports both @njit and @njit(...))"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
@@ -1,9 +1,54 @@
+import math
 from typing import Tuple
 import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
-import matplotlib.pyplot as plt # type: ignore
 from sklearn.metrics import mean_absolute_error, mean_squared_error # type: ignore  
 
+from .plotting import _configure_plot_style
+from .jit import HAS_NUMBA, njit
+
+
+@njit(cache=True)
+def _rmse_nb(y_true, y_pred, skipna):
+    """
+    RMSE in a single pass without the temporary arrays of the numpy expression.
+    With skipna, pairs with a missing value are left out (as in a pandas mean).
+    """
+    total = 0.0
+    count = 0
+    for i in range(y_true.shape[0]):
+        diff = y_true[i] - y_pred[i]
+        if skipna and math.isnan(diff):
+            continue
+        total += diff * diff
+        count += 1
+    if count == 0:
+        return np.nan
+    return math.sqrt(total / count)
+
+
+def _rmse(y_true, y_pred) -> float:
+    """
+    RMSE between y_true and y_pred, with the same result as np.sqrt(np.mean((y_true - y_pred)**2)):
+    pandas inputs skip missing values and two Series are aligned on their index.
+    """
+    if (isinstance(y_true, pd.DataFrame) or isinstance(y_pred, pd.DataFrame) or
+            (isinstance(y_true, pd.Series) and isinstance(y_pred, pd.Series) and
+             not y_true.index.equals(y_pred.index))):
+        return np.sqrt(np.mean((y_true - y_pred)**2))
+    skipna = isinstance(y_true, pd.Series) or isinstance(y_pred, pd.Series)
+    y_true = np.ascontiguousarray(y_true, dtype=float).ravel()
+    y_pred = np.ascontiguousarray(y_pred, dtype=float).ravel()
+    if y_true.shape[0] != y_pred.shape[0]:
+        # The kernel would read past the end of the shorter array
+        raise ValueError('y_true and y_pred have different lengths: %d and %d'
+                         % (y_true.shape[0], y_pred.shape[0]))
+    if HAS_NUMBA:
+        return _rmse_nb(y_true, y_pred, skipna)
+    # Without numba the plain python loop would be much slower than numpy
+    squared_errors = (y_true - y_pred)**2
+    return np.sqrt(np.nanmean(squared_errors) if skipna else np.mean(squared_errors))
+
 
 def print_static_rmse(actual: np.array, predicted: np.array, start_from: int=0, verbose: int=0) -> Tuple[float, float]:
     """
@@ -27,7 +72,7 @@ def print_dynamic_rmse(actuals: np.array, predicted: np.array, original: np.arra
     using the original array's std deviation. That way, the forecast of 2 values does not
     result in a larger Normalized RMSE since the std deviation of 2 values will be v small.
     """
-    rmse = np.sqrt(np.mean((actuals - predicted)**2))
+    rmse = _rmse(actuals, predicted)
     norm_rmse = rmse/original.std()
     if toprint:
         print('    RMSE = {:,.2f}'.format(rmse))
@@ -55,8 +100,7 @@ def print_rmse(y: np.array, y_hat: np.array) -> float:
     """
     Calculating Root Mean Square Error https://en.wikipedia.org/wiki/Root-mean-square_deviation
     """
-    mse = np.mean((y - y_hat)**2)
-    return np.sqrt(mse)
+    return _rmse(y, y_hat)
 
 
 def print_mape(y: np.array, y_hat: np.array) -> float:
@@ -74,6 +118,8 @@ def print_ts_model_stats(actuals: np.array, predicted: np.array, number_as_perce
     in the input as "number_as_percentage" and it will return the MAE and RMSE as a
     ratio of that number. Returns MAE, MAE_as_percentage, and RMSE_as_percentage
     """
+    import matplotlib.pyplot as plt  # type: ignore
+    _configure_plot_style()
     #print(len(actuals))
     #print(len(predicted))
     plt.figure(figsize=(15,8))
@@ -0,0 +1,18 @@
+"""Lazy setup of the plotting libraries
+
+matplotlib and seaborn are slow to import, so they are only imported by the functions
+that actually make a plot. Those functions call _configure_plot_style() first.
+"""
+
+_PLOT_STYLE_CONFIGURED = False
+
+
+def _configure_plot_style():
+    """
+    Imports seaborn and sets the default plot style, only the first time it is called
+    """
+    global _PLOT_STYLE_CONFIGURED
+    if not _PLOT_STYLE_CONFIGURED:
+        import seaborn as sns  # type: ignore
+        sns.set(style="white", color_codes=True)
+        _PLOT_STYLE_CONFIGURED = True
@@ -1,15 +1,11 @@
 import numpy as np # type: ignore
 import pandas as pd # type: ignore
-import matplotlib.pyplot as plt # type: ignore
-import seaborn as sns # type: ignore
-# This gives an error when running from a python script.
-# Maybe, this should be set in the jupyter notebook directly.
-# get_ipython().magic('matplotlib inline')
-sns.set(style="white", color_codes=True)
 
 from sklearn.model_selection import TimeSeriesSplit # type: ignore
 from sklearn.model_selection import GridSearchCV # type: ignore
 
+from .plotting import _configure_plot_style
+
 #########################################################
 def cross_validation_time_series(model, df, preds, target,n_times=10,verbose=0):
     """
@@ -109,6 +105,8 @@ def rolling_validation_time_series(model, df, preds, target,train_size=0,
                                 %(index+1, weighted_ave_rmse,weighted_ave_rmse/y[:].std()))
             #############################
             if verbose == 1 or verbose == 2:
+                import matplotlib.pyplot as plt  # type: ignore
+                _configure_plot_style()
                 fig, ax1 = plt.subplots(nrows=1,ncols=1,figsize=(12,8))
                 ax1.plot(df[target],label='In-Sample Data', linestyle='-')
                 ax1.plot(df['predictions'],'g',alpha=0.6,label='Rolling Forecast')
@@ -172,6 +170,8 @@ def ts_model_validation(model_results):
     print('\nTest for all MA roots outside unit circle (>1): {}'.format(maroots_outside_unit_circle))
 ############################################################################################################
 def quick_ts_plot(y_true, y_pred, modelname='Prophet'):
+    import matplotlib.pyplot as plt  # type: ignore
+    _configure_plot_style()
     fig,ax = plt.subplots(figsize=(15,7))
     labels = ['actual','forecast']
     y_true.plot(ax=ax,)
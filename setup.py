@@ -24,7 +24,8 @@ setuptools.setup(
         "scikit-learn==0.22.2",
         "fbprophet",
         "statsmodels",
-        "tscv"
+        "tscv",
+        "joblib"
     ],
     classifiers=[
         "Programming Language :: Python :: 3",